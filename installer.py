@@ -11,6 +11,10 @@ import errno
 import subprocess
 import webbrowser
 import sys
+import re
+import bisect
+import copy
+import functools
 
 import requests
 import tempfile
@@ -18,6 +22,8 @@ import win32api
 import time
 import hashlib
 import ctypes
+from ctypes import wintypes
+import msvcrt
 import winreg
 import psutil
 import struct
@@ -28,7 +34,8 @@ from enum import IntEnum
 import py7zr  # Bundled for extraction
 import configparser
 import tkinter.font as tkfont
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from collections import deque
 import urllib3
 
 # Disable SSL warnings for f4se.silverlock.org (weak certificate)
@@ -52,6 +59,136 @@ except Exception:
         except Exception:
             pass  # DPI awareness not available
 
+# London-specific files in the Data root (London*.esm/esp/ba2, LondonWorldSpace*, FOLON*)
+LONDON_FILE_PATTERN = re.compile(r'(?:London.*\.(?:esm|esp|ba2)|LondonWorldSpace.*|FOLON.*)$', re.IGNORECASE)
+
+# Percentage tokens in 7za -bsp1 progress output
+SEVENZIP_PERCENT_PATTERN = re.compile(rb'(\d{1,3})%')
+
+# Block cloning (copy-on-write) support for ReFS / Dev Drive volumes
+FSCTL_DUPLICATE_EXTENTS_TO_FILE = 0x00098344
+FILE_SUPPORTS_BLOCK_REFCOUNTING = 0x08000000
+
+class DUPLICATE_EXTENTS_DATA(ctypes.Structure):
+    """Input buffer for FSCTL_DUPLICATE_EXTENTS_TO_FILE"""
+    _fields_ = [
+        ("FileHandle", wintypes.HANDLE),
+        ("SourceFileOffset", ctypes.c_longlong),
+        ("TargetFileOffset", ctypes.c_longlong),
+        ("ByteCount", ctypes.c_longlong),
+    ]
+
+# Storage device queries (seek penalty distinguishes HDDs from SSDs)
+IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+STORAGE_ADAPTER_PROPERTY = 1
+STORAGE_DEVICE_SEEK_PENALTY_PROPERTY = 7
+BUS_TYPE_NVME = 17
+FILE_SHARE_READ_WRITE = 0x00000003
+OPEN_EXISTING = 3
+
+class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+    """Input buffer for IOCTL_STORAGE_QUERY_PROPERTY"""
+    _fields_ = [
+        ("PropertyId", wintypes.DWORD),
+        ("QueryType", wintypes.DWORD),  # 0 = PropertyStandardQuery
+        ("AdditionalParameters", ctypes.c_ubyte * 1),
+    ]
+
+class STORAGE_ADAPTER_DESCRIPTOR(ctypes.Structure):
+    """Output buffer for StorageAdapterProperty"""
+    _fields_ = [
+        ("Version", wintypes.DWORD),
+        ("Size", wintypes.DWORD),
+        ("MaximumTransferLength", wintypes.DWORD),
+        ("MaximumPhysicalPages", wintypes.DWORD),
+        ("AlignmentMask", wintypes.DWORD),
+        ("AdapterUsesPio", wintypes.BOOLEAN),
+        ("AdapterScansDown", wintypes.BOOLEAN),
+        ("CommandQueueing", wintypes.BOOLEAN),
+        ("AcceleratedTransfer", wintypes.BOOLEAN),
+        ("BusType", ctypes.c_ubyte),
+        ("BusMajorVersion", wintypes.WORD),
+        ("BusMinorVersion", wintypes.WORD),
+        ("SrbType", ctypes.c_ubyte),
+        ("AddressType", ctypes.c_ubyte),
+    ]
+
+class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+    """Output buffer for StorageDeviceSeekPenaltyProperty"""
+    _fields_ = [
+        ("Version", wintypes.DWORD),
+        ("Size", wintypes.DWORD),
+        ("IncursSeekPenalty", wintypes.BOOLEAN),
+    ]
+
+# CopyFileExW progress routine and flags
+PROGRESS_CONTINUE = 0
+PROGRESS_CANCEL = 1
+COPY_FILE_NO_BUFFERING = 0x00001000
+ERROR_REQUEST_ABORTED = 1235
+LPPROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+    wintypes.DWORD,
+    ctypes.c_longlong, ctypes.c_longlong,  # TotalFileSize, TotalBytesTransferred
+    ctypes.c_longlong, ctypes.c_longlong,  # StreamSize, StreamBytesTransferred
+    wintypes.DWORD, wintypes.DWORD,        # dwStreamNumber, dwCallbackReason
+    wintypes.HANDLE, wintypes.HANDLE,      # hSourceFile, hDestinationFile
+    wintypes.LPVOID                        # lpData
+)
+
+# Private kernel32 handle with prototypes declared once, so calls from worker threads never
+# mutate the shared ctypes.windll.kernel32 function objects
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                  wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+_kernel32.CreateFileW.restype = wintypes.HANDLE
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+_kernel32.CloseHandle.restype = wintypes.BOOL
+_kernel32.GetVolumePathNameW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD]
+_kernel32.GetVolumePathNameW.restype = wintypes.BOOL
+_kernel32.GetVolumeInformationW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD, wintypes.LPDWORD,
+                                            wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPWSTR, wintypes.DWORD]
+_kernel32.GetVolumeInformationW.restype = wintypes.BOOL
+_kernel32.GetDiskFreeSpaceW.argtypes = [wintypes.LPCWSTR, wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD]
+_kernel32.GetDiskFreeSpaceW.restype = wintypes.BOOL
+_kernel32.GetVolumeNameForVolumeMountPointW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD]
+_kernel32.GetVolumeNameForVolumeMountPointW.restype = wintypes.BOOL
+_kernel32.DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+                                      wintypes.LPVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+_kernel32.DeviceIoControl.restype = wintypes.BOOL
+_kernel32.K32EnumProcesses.argtypes = [ctypes.POINTER(wintypes.DWORD), wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+_kernel32.K32EnumProcesses.restype = wintypes.BOOL
+_kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_kernel32.OpenProcess.restype = wintypes.HANDLE
+_kernel32.QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)]
+_kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+_kernel32.CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, LPPROGRESS_ROUTINE, wintypes.LPVOID,
+                                  ctypes.POINTER(wintypes.BOOL), wintypes.DWORD]
+_kernel32.CopyFileExW.restype = wintypes.BOOL
+_kernel32.SetDllDirectoryW.argtypes = [wintypes.LPCWSTR]
+_kernel32.SetDllDirectoryW.restype = wintypes.BOOL
+_kernel32.GetLogicalDrives.argtypes = []
+_kernel32.GetLogicalDrives.restype = wintypes.DWORD
+
+@functools.lru_cache(maxsize=None)
+def _copy_buf_size(workers=1):
+    """Chunk size for buffered file copies, scaled to installed RAM.
+
+    Concurrent copies (workers > 1) are capped at 16MB each so a full pool stays within a few hundred MB.
+    """
+    try:
+        gb = psutil.virtual_memory().total / (1 << 30)
+    except Exception:
+        return 4 << 20
+    if gb >= 8:
+        size = 64 << 20
+    elif gb >= 4:
+        size = 32 << 20
+    elif gb >= 1:
+        size = 8 << 20
+    else:
+        size = 64 << 10
+    return min(size, 16 << 20) if workers > 1 else size
+
 # ===== INTEGRATED DOWNGRADER CLASSES =====
 class ArchiveVersionEnum(IntEnum):
     """BA2 Archive version constants"""
@@ -316,7 +453,7 @@ class ESMPatcher:
             logging.info(f"Running: {' '.join(cmd)}")
             logging.info(f"Using patch: {selected_patch['patch']} for {selected_patch['description']}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, creationflags=subprocess.CREATE_NO_WINDOW)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=120, creationflags=subprocess.CREATE_NO_WINDOW)
             
             if result.returncode == 0:
                 # Verify the patched file exists
@@ -681,6 +818,9 @@ class FalloutLondonVRInstaller:
         self.f4vr_path = tk.StringVar()
         self.london_data_path = tk.StringVar()
         self.mo2_path = tk.StringVar()
+        # Cached so worker threads don't cross into Tcl for every path they build
+        self._mods_dir = ""
+        self.mo2_path.trace_add("write", lambda *args: setattr(self, '_mods_dir', os.path.join(self.mo2_path.get(), "mods")))
         self.existing_install_path = tk.StringVar()
         self.london_installed = False
         self.f4_version = "Unknown"
@@ -688,12 +828,35 @@ class FalloutLondonVRInstaller:
         self.missing_dlc = []
         self.needs_downgrade = False
         self.cancel_requested = False
+        self._assets_dir = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets")
+        self._bundled_7za = os.path.join(self._assets_dir, "7za.exe")
+        self._icon_path = os.path.join(self._assets_dir, "icon.ico")
+        self.use_hardlinks = tk.BooleanVar(value=False)  # Hard link game files instead of copying (same volume only)
+        # Plain mirror of the checkbox for copy worker threads, kept current on the main thread
+        self._use_hardlinks = False
+        self.use_hardlinks.trace_add("write", lambda *args: setattr(self, '_use_hardlinks', self.use_hardlinks.get()))
+        self._block_clone_volumes = {}  # Volume root -> (supports block cloning, cluster size)
+        self._block_clone_dirs = {}  # Destination directory -> cached _block_clone_volumes entry
+        self._rotational_cache = {}  # st_dev -> True if the device is a spinning disk
+        self._download_dir_cache = {}  # MO2 path -> directory chosen by _download_dir for archive downloads
+        self._dlc_cache = {}  # (f4, london, f4vr) paths -> detect_dlc_in_both_games result
+        # One HTTP session for all downloads so connections are pooled and reused (retries are handled by the caller)
+        self._http = requests.Session()
+        self._http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+        self._http.headers["Accept-Encoding"] = "identity"  # Archives are already compressed
+        self._ui_lock = threading.Lock()  # Guards _pending_ui and _ui_flush_scheduled
+        self._pending_ui = {}  # Latest "progress", "label" and "message" posted by any thread, applied by _flush_ui
+        self._ui_flush_scheduled = False  # True while one _flush_ui is queued with after_idle
         self.update_mode = False
         self.is_update_detected = False
         self.detected_install_path = None
         self.installation_mode = tk.StringVar(value="fresh")
         self.progress = None
         self.progress_label = None
+        self._progress_alive = False  # Cleared by the <Destroy> binding, avoids winfo_exists() round-trips
+        self.progress_var = tk.DoubleVar(value=0.0)  # Bound to the progress bar value
+        self.progress_label_var = tk.StringVar()  # Bound to the progress label text
+        self._last_progress_update = 0.0  # Monotonic timestamp of the last throttled progress refresh
         self.message_label = None
         self.london_data_entry = None
         self.browse_button = None
@@ -1126,35 +1289,47 @@ class FalloutLondonVRInstaller:
                 logging.debug(f"Widget no longer exists: {widget}")
 
     def update_message(self, text, color="#ffffff"):
-        """Safely update message label"""
-        if hasattr(self, 'message_label') and self.message_label:
-            try:
-                if self.message_label.winfo_exists():
-                    self.root.after(0, lambda t=text, c=color: 
-                        self.message_label.config(text=t, fg=c) 
-                        if self.message_label.winfo_exists() else None)
-            except tk.TclError:
-                logging.debug("Message label no longer exists")
+        """Show a status message; safe to call from any thread"""
+        self._post_progress(message=(text, color))
+
+    def _post_progress(self, value=None, label_text=None, message=None):
+        """Record the latest progress value, label and (text, colour) message from any thread.
+        Values posted before the queued flush runs simply overwrite each other."""
+        with self._ui_lock:
+            if value is not None:
+                self._pending_ui["progress"] = value
+            if label_text is not None:
+                self._pending_ui["label"] = label_text
+            if message is not None:
+                self._pending_ui["message"] = message
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
+        try:
+            self.root.after_idle(self._flush_ui)
+        except (RuntimeError, tk.TclError):
+            logging.debug("Root window destroyed, dropping UI update")
+
+    def _flush_ui(self):
+        """Main-thread half of _post_progress; applies whatever is newest in one pass"""
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+            self._ui_flush_scheduled = False
+        try:
+            if self._progress_alive:
+                if "progress" in pending:
+                    self.progress_var.set(pending["progress"])
+                if "label" in pending:
+                    self.progress_label_var.set(pending["label"])
+            if "message" in pending and self.message_label and self.message_label.winfo_exists():
+                text, color = pending["message"]
+                self.message_label.config(text=text, fg=color)
+        except tk.TclError:
+            logging.debug("Progress widgets no longer exist")
 
     def update_progress(self, value, label_text=None):
         """Safely update progress bar and label"""
-        if hasattr(self, 'progress') and self.progress:
-            try:
-                if self.progress.winfo_exists():
-                    self.root.after(0, lambda v=value: 
-                        self.progress.__setitem__("value", v) 
-                        if self.progress.winfo_exists() else None)
-            except tk.TclError:
-                logging.debug("Progress bar no longer exists")
-        
-        if label_text and hasattr(self, 'progress_label') and self.progress_label:
-            try:
-                if self.progress_label.winfo_exists():
-                    self.root.after(0, lambda lt=label_text: 
-                        self.progress_label.config(text=lt) 
-                        if self.progress_label.winfo_exists() else None)
-            except tk.TclError:
-                logging.debug("Progress label no longer exists")
+        self._post_progress(value, label_text)
 
     def perform_installation(self):
         """Perform the complete installation process"""
@@ -1166,25 +1341,49 @@ class FalloutLondonVRInstaller:
             logging.info(f"User selected London path: {self.london_data_path.get()}")
             
             if not self.mo2_path.get():
-                self.root.after(0, lambda: self.message_label.config(text="Please select a valid installation directory.", fg="#ff0000") if self.message_label.winfo_exists() else None)
+                self.update_message("Please select a valid installation directory.", "#ff0000")
                 return
 
-            # Step 1: Download and install MO2
+            # Step 1: Download and install MO2; the F4SEVR download runs in the background during extraction
             mo2_archive = self.download_mo2_portable()
-            self.extract_mo2(mo2_archive)
+            f4sevr_cancel = threading.Event()
+            download_executor = ThreadPoolExecutor(max_workers=1)
+            f4sevr_future = download_executor.submit(self.download_f4sevr, False, f4sevr_cancel)
+            try:
+                self.extract_mo2(mo2_archive)
+            except BaseException:
+                # Surface the MO2 failure now: stop the F4SEVR download and give it a moment to
+                # delete its partial archive so the staging folder can be removed afterwards
+                f4sevr_cancel.set()
+                download_executor.shutdown(wait=False, cancel_futures=True)
+                wait([f4sevr_future], timeout=5)
+                if f4sevr_future.done() and not f4sevr_future.cancelled() and f4sevr_future.exception() is None:
+                    self._discard_download(f4sevr_future.result())  # Finished before the cancel landed
+                raise
+            try:
+                f4sevr_archive = f4sevr_future.result()
+            finally:
+                download_executor.shutdown()
 
-            # Step 2: Download and install F4SEVR to Fallout 4 VR dir
-            f4sevr_archive = self.download_f4sevr()
+            # Step 2: Install F4SEVR to Fallout 4 VR dir
             self.extract_and_install_f4sevr(f4sevr_archive, self.f4vr_path.get())
 
-            # Step 3: Download and install FRIK
-            self.download_and_install_frik()
-
-            # Step 4: Download and install Comfort Swim VR
-            self.download_and_install_comfort_swim()
-
-            # Step 5: Download and install Buffout 4 NG
-            self.download_and_install_buffout4()
+            # Steps 3-5: FRIK, Comfort Swim VR and Buffout 4 NG write to separate mod folders, so each is
+            # downloaded and extracted on its own worker; the progress bar counts finished mods
+            self.update_message("Installing VR mods", "#ffffff")
+            self.create_progress_bar("Installing VR mods")
+            mod_steps = [
+                (self.download_frik, self.extract_frik),
+                (self.download_comfort_swim, self.extract_comfort_swim),
+                (self.download_buffout4, self.extract_buffout4),
+            ]
+            with ThreadPoolExecutor(max_workers=len(mod_steps)) as mod_executor:
+                mod_futures = [mod_executor.submit(lambda d=download, e=extract: e(d(False), False))
+                               for download, extract in mod_steps]
+                for done, future in enumerate(as_completed(mod_futures), 1):
+                    future.result()
+                    progress = done * 100 / len(mod_steps)
+                    self._post_progress(progress, f"Installing VR mods ({done}/{len(mod_steps)})")
 
             # Step 6: Copy MO2 assets
             self.copy_mo2_assets()
@@ -1203,21 +1402,20 @@ class FalloutLondonVRInstaller:
                 self.perform_downgrade_step()
             
             # Step 12: Complete installation
-            self.root.after(0, lambda: self.message_label.config(text="Installation completed successfully!", fg="#00ff00") if self.message_label.winfo_exists() else None)
+            self.update_message("Installation completed successfully!", "#00ff00")
             logging.info("Installation completed successfully")
             
             # Show completion buttons
             self.show_completion_ui()
             
-            # Create desktop shortcut
-            self.create_desktop_shortcut()
-            
-            # Create Start Menu shortcuts
-            self.create_start_menu_shortcuts()
+            # Create desktop and Start Menu shortcuts
+            self.create_shortcuts()
         except Exception as e:
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Installation failed: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Installation failed: {e}", "#ff6666")
             logging.error(f"Installation failed: {e}")
             raise
+        finally:
+            self._remove_download_dir()
 
     def detect_steam_paths(self) -> list[str]:
         """Detect Steam installation paths from registry and libraryfolders.vdf"""
@@ -1329,11 +1527,313 @@ class FalloutLondonVRInstaller:
             logging.warning(f"Could not remove read-only attribute from {file_path}: {e}")
             # Try alternative method for Windows
             try:
-                subprocess.run(['attrib', '-R', file_path], check=False, capture_output=True)
+                subprocess.run(['attrib', '-R', file_path], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 logging.debug(f"Removed read-only using attrib command: {file_path}")
             except Exception as attrib_error:
                 logging.warning(f"Attrib command also failed for {file_path}: {attrib_error}")
 
+    def _iter_files_with_sizes(self, dirpath, exclude_names=frozenset(), exclude_substrings=()):
+        """Yield (path, size) for every file under dirpath using os.scandir.
+
+        Sizes come from the cached directory entry instead of a separate stat per file.
+        Subdirectories whose lowercase name is in exclude_names are skipped, as is any
+        directory whose lowercase path contains one of exclude_substrings.
+        """
+        if exclude_substrings:
+            dirpath_lower = dirpath.lower()
+            if any(excl in dirpath_lower for excl in exclude_substrings):
+                return
+        try:
+            it = os.scandir(dirpath)
+        except OSError as e:
+            logging.warning(f"Could not scan directory {dirpath}: {e}")
+            return
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.lower() not in exclude_names:
+                            yield from self._iter_files_with_sizes(entry.path, exclude_names, exclude_substrings)
+                    elif entry.is_file():
+                        yield entry.path, entry.stat().st_size
+                except OSError as e:
+                    logging.warning(f"Could not get size of {entry.path}: {e}")
+
+    def _iter_copy_pairs(self, src_dir, dest_dir, exclude_names=frozenset(), exclude_substrings=()):
+        """Yield (src_file, dest_file, size) for every file under src_dir, mirrored under dest_dir"""
+        src_prefix_len = len(os.path.join(src_dir, ""))
+        for src_file, size in self._iter_files_with_sizes(src_dir, exclude_names, exclude_substrings):
+            yield src_file, os.path.join(dest_dir, src_file[src_prefix_len:]), size
+
+    def _make_dest_dirs(self, files_to_copy):
+        """Create the destination directory of every (src, dest, ...) entry once, before the copy starts"""
+        for dir_path in {os.path.dirname(f[1]) for f in files_to_copy}:
+            os.makedirs(dir_path, exist_ok=True)
+
+    def _try_clone_or_link(self, src, dst, allow_link=True):
+        """Create dst from src without copying file data when the filesystem allows it.
+
+        Tries a hard link first (opt-in via the "Fast link install" checkbox), then a
+        ReFS block clone. Both require src and dst on the same volume. Pass allow_link=False
+        for files that are modified in place later (e.g. BA2s that get downgraded), since a
+        hard link would change the user's original file too. Returns False when the caller
+        should fall back to a regular copy.
+        """
+        if allow_link and self._use_hardlinks:
+            try:
+                if os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev:
+                    if os.path.lexists(dst):
+                        self.remove_readonly_and_overwrite(dst)
+                        os.remove(dst)
+                    os.link(src, dst)
+                    return True
+            except OSError as e:
+                logging.debug(f"Hard link failed for {dst}, falling back to copy: {e}")
+
+        if sys.platform != "win32":
+            return False
+        return self._try_block_clone(src, dst)
+
+    def _preallocate(self, fileobj, size):
+        """Reserve size bytes for a file opened for writing so it gets one contiguous allocation"""
+        if size <= 0:
+            return
+        try:
+            # Extends the file with SetEndOfFile; the write position stays at 0
+            fileobj.truncate(size)
+        except OSError:
+            pass  # Unsupported filesystem - the file just grows as it is written
+
+    def _copy_file_native(self, src_file, dest_file, size, on_bytes=None):
+        """Copy a file with CopyFileExW so the transfer runs in the kernel without holding the GIL.
+
+        on_bytes(delta) is called from the progress routine with the bytes written since the
+        previous call. Files over 64MB use unbuffered I/O. Raises InterruptedError when the
+        user cancels mid-copy and OSError on any other failure.
+        """
+        last_transferred = 0
+
+        def progress_routine(total_file_size, total_transferred, stream_size, stream_transferred,
+                             stream_number, callback_reason, source_handle, dest_handle, data):
+            nonlocal last_transferred
+            if on_bytes is not None and total_transferred > last_transferred:
+                on_bytes(total_transferred - last_transferred)
+                last_transferred = total_transferred
+            return PROGRESS_CANCEL if self.cancel_requested else PROGRESS_CONTINUE
+
+        callback = LPPROGRESS_ROUTINE(progress_routine)
+        flags = COPY_FILE_NO_BUFFERING if size > 64 * 1024 * 1024 else 0
+        cancel_flag = wintypes.BOOL(False)
+        if not _kernel32.CopyFileExW(src_file, dest_file, callback, None, ctypes.byref(cancel_flag), flags):
+            # use_last_error snapshots the code before the Python progress routine can clobber it
+            error = ctypes.WinError(ctypes.get_last_error())
+            if error.winerror == ERROR_REQUEST_ABORTED or self.cancel_requested:
+                raise InterruptedError("Installation cancelled by user")
+            raise error
+
+    def _remove_tree(self, path):
+        """Delete a directory tree, clearing the read-only attribute on entries that refuse removal"""
+        def clear_readonly_and_retry(func, failed_path, exc_info):
+            if not os.access(failed_path, os.W_OK):
+                os.chmod(failed_path, stat.S_IWRITE)
+                func(failed_path)
+            else:
+                raise exc_info[1]
+        
+        shutil.rmtree(path, onerror=clear_readonly_and_retry)
+
+    def _install_file(self, src, dst, allow_link=True):
+        """Link, clone or copy src to dst, clearing a read-only destination only if the copy is refused"""
+        try:
+            if not self._try_clone_or_link(src, dst, allow_link=allow_link):
+                shutil.copy2(src, dst)
+        except PermissionError:
+            # Existing read-only destination; clear the attribute and retry once
+            self.remove_readonly_and_overwrite(dst)
+            shutil.copy2(src, dst)
+
+    def _get_block_clone_info(self, path):
+        """Return (supports block cloning, cluster size) for the volume containing path"""
+        # Cached per directory so the common (unsupported) case costs a dict lookup per file
+        info = self._block_clone_dirs.get(path)
+        if info is None:
+            info = self._block_clone_dirs[path] = self._query_block_clone_info(path)
+        return info
+
+    def _query_block_clone_info(self, path):
+        """Query the volume containing path for block cloning support and cluster size"""
+        volume_buf = ctypes.create_unicode_buffer(260)
+        if not _kernel32.GetVolumePathNameW(path, volume_buf, len(volume_buf)):
+            return False, 0
+        volume_root = volume_buf.value
+        if volume_root in self._block_clone_volumes:
+            return self._block_clone_volumes[volume_root]
+
+        info = (False, 0)
+        fs_flags = wintypes.DWORD()
+        if _kernel32.GetVolumeInformationW(volume_root, None, 0, None, None, ctypes.byref(fs_flags), None, 0):
+            if fs_flags.value & FILE_SUPPORTS_BLOCK_REFCOUNTING:
+                sectors_per_cluster = wintypes.DWORD()
+                bytes_per_sector = wintypes.DWORD()
+                free_clusters = wintypes.DWORD()
+                total_clusters = wintypes.DWORD()
+                if _kernel32.GetDiskFreeSpaceW(volume_root, ctypes.byref(sectors_per_cluster), ctypes.byref(bytes_per_sector),
+                                              ctypes.byref(free_clusters), ctypes.byref(total_clusters)):
+                    info = (True, sectors_per_cluster.value * bytes_per_sector.value)
+        self._block_clone_volumes[volume_root] = info
+        logging.debug(f"Block cloning on {volume_root}: {'supported' if info[0] else 'not supported'}")
+        return info
+
+    def _try_block_clone(self, src, dst):
+        """Clone src into dst with FSCTL_DUPLICATE_EXTENTS_TO_FILE (copy-on-write, no data copied)"""
+        try:
+            dst_dir = os.path.dirname(dst)
+            supported, cluster_size = self._get_block_clone_info(dst_dir)
+            if not supported or cluster_size <= 0:
+                return False
+            src_stat = os.stat(src)
+            if src_stat.st_dev != os.stat(dst_dir).st_dev:
+                return False
+            # Source and target must share the sparse attribute; keep it simple and skip sparse files
+            if getattr(src_stat, 'st_file_attributes', 0) & stat.FILE_ATTRIBUTE_SPARSE_FILE:
+                return False
+            size = src_stat.st_size
+
+            if os.path.lexists(dst):
+                self.remove_readonly_and_overwrite(dst)
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdest:
+                fdest.truncate(size)
+                if size:
+                    src_handle = msvcrt.get_osfhandle(fsrc.fileno())
+                    dst_handle = msvcrt.get_osfhandle(fdest.fileno())
+                    # Regions must be cluster aligned; the last region may extend past EOF
+                    total = (size + cluster_size - 1) // cluster_size * cluster_size
+                    max_chunk = (1 << 30) // cluster_size * cluster_size  # ByteCount must stay below 4 GB
+                    offset = 0
+                    returned = wintypes.DWORD()
+                    while offset < total:
+                        byte_count = min(max_chunk, total - offset)
+                        data = DUPLICATE_EXTENTS_DATA(src_handle, offset, offset, byte_count)
+                        if not _kernel32.DeviceIoControl(
+                                dst_handle, FSCTL_DUPLICATE_EXTENTS_TO_FILE,
+                                ctypes.byref(data), ctypes.sizeof(data), None, 0, ctypes.byref(returned), None):
+                            raise ctypes.WinError(ctypes.get_last_error())
+                        offset += byte_count
+            shutil.copystat(src, dst)
+            return True
+        except OSError as e:
+            logging.debug(f"Block clone failed for {dst}, falling back to copy: {e}")
+            try:
+                if os.path.exists(dst):
+                    os.remove(dst)
+            except OSError:
+                pass
+            return False
+
+    def _is_rotational_drive(self, path):
+        """Return True if path lives on a spinning disk; False for SSDs or when unknown"""
+        path = self._nearest_existing_path(path)
+        try:
+            dev = os.stat(path).st_dev
+        except OSError:
+            return False
+        if dev in self._rotational_cache:
+            return self._rotational_cache[dev]
+
+        rotational = False
+        try:
+            penalty = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+            if self._query_storage_property(path, STORAGE_DEVICE_SEEK_PENALTY_PROPERTY, penalty):
+                rotational = bool(penalty.IncursSeekPenalty)
+        except Exception as e:
+            logging.debug(f"Storage type probe failed for {path}: {e}")
+        self._rotational_cache[dev] = rotational
+        logging.info(f"Storage for {path}: {'HDD' if rotational else 'SSD/unknown'}")
+        return rotational
+
+    def _download_dir(self):
+        """Pick where downloaded archives are staged: %TEMP% unless it sits on an HDD or is short on space"""
+        mo2_dir = os.path.dirname(self._mods_dir)
+        if mo2_dir in self._download_dir_cache:
+            return self._download_dir_cache[mo2_dir]
+        
+        temp_dir = tempfile.gettempdir()
+        chosen = temp_dir
+        if mo2_dir:
+            try:
+                temp_free = shutil.disk_usage(temp_dir).free
+                mo2_free = shutil.disk_usage(self._nearest_existing_path(mo2_dir)).free
+                temp_slow = self._is_rotational_drive(temp_dir) or temp_free < 2 * 1024 ** 3
+                # Staging on the install volume also makes 7za's read a same-disk, usually SSD, read
+                if temp_slow and not self._is_rotational_drive(mo2_dir) and mo2_free > temp_free:
+                    chosen = os.path.join(mo2_dir, "_installer_downloads")
+                    os.makedirs(chosen, exist_ok=True)
+            except OSError as e:
+                logging.debug(f"Download directory probe failed, using {temp_dir}: {e}")
+                chosen = temp_dir
+        
+        logging.info(f"Staging downloads in {chosen}")
+        self._download_dir_cache[mo2_dir] = chosen
+        return chosen
+
+    def _remove_download_dir(self):
+        """Remove any staging folder _download_dir created inside an install directory once it is empty"""
+        temp_dir = tempfile.gettempdir()
+        for mo2_dir, download_dir in list(self._download_dir_cache.items()):
+            if download_dir != temp_dir:
+                try:
+                    os.rmdir(download_dir)
+                except OSError:
+                    continue  # Still holds an archive from a failed step
+                # Forget it so the next download re-creates the folder
+                del self._download_dir_cache[mo2_dir]
+
+    def _nearest_existing_path(self, path):
+        """Return path or its closest existing parent (destinations may not exist yet)"""
+        while not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return path
+
+    def _detect_storage_workers(self, path):
+        """Copy worker count matched to the device behind path: 2 for HDD, 8 for SATA SSD/unknown, 16 for NVMe"""
+        if self._is_rotational_drive(path):
+            return 2
+        path = self._nearest_existing_path(path)
+        nvme = False
+        try:
+            adapter = STORAGE_ADAPTER_DESCRIPTOR()
+            if self._query_storage_property(path, STORAGE_ADAPTER_PROPERTY, adapter):
+                nvme = adapter.BusType == BUS_TYPE_NVME
+        except Exception as e:
+            logging.debug(f"Storage bus probe failed for {path}: {e}")
+        return 16 if nvme else 8
+
+    def _query_storage_property(self, path, property_id, out_struct):
+        """Fill out_struct with IOCTL_STORAGE_QUERY_PROPERTY for the volume containing path"""
+        kernel32 = _kernel32
+        mount_buf = ctypes.create_unicode_buffer(260)
+        volume_buf = ctypes.create_unicode_buffer(260)
+        if not kernel32.GetVolumePathNameW(path, mount_buf, len(mount_buf)):
+            return False
+        if not kernel32.GetVolumeNameForVolumeMountPointW(mount_buf.value, volume_buf, len(volume_buf)):
+            return False
+        # \\?\Volume{GUID}\ -> \\?\Volume{GUID} opens the volume device itself
+        handle = kernel32.CreateFileW(volume_buf.value.rstrip("\\"), 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None)
+        if not handle or handle == wintypes.HANDLE(-1).value:
+            return False
+        try:
+            query = STORAGE_PROPERTY_QUERY(property_id, 0)
+            returned = wintypes.DWORD()
+            return bool(kernel32.DeviceIoControl(
+                wintypes.HANDLE(handle), IOCTL_STORAGE_QUERY_PROPERTY,
+                ctypes.byref(query), ctypes.sizeof(query),
+                ctypes.byref(out_struct), ctypes.sizeof(out_struct), ctypes.byref(returned), None))
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(handle))
+
     def detect_existing_installation(self):
         """Detect existing Fallout London VR installation"""
         search_paths = []
@@ -1993,11 +2493,11 @@ class FalloutLondonVRInstaller:
                 mo2_assets_archive = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "MO2.7z")
                 if os.path.exists(mo2_assets_archive):
                     temp_dir = tempfile.mkdtemp(prefix="folvr_modlist_")
-                    bundled_7za = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "7za.exe")
+                    bundled_7za = self._bundled_7za
                     
                     # Extract just the modlist.txt file
                     extract_cmd = [bundled_7za, "e", mo2_assets_archive, f"-o{temp_dir}", "MO2/profiles/Default/modlist.txt", "-y", "-bb0", "-bd"]
-                    result = subprocess.run(extract_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                    result = subprocess.run(extract_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, creationflags=subprocess.CREATE_NO_WINDOW)
                     
                     source_modlist = os.path.join(temp_dir, "modlist.txt")
                     if os.path.exists(source_modlist):
@@ -2263,6 +2763,12 @@ class FalloutLondonVRInstaller:
                                                     bg=accent_color, fg=fg_color, bd=0, relief="flat",
                                                     activebackground="#005ba1", padx=self.get_scaled_value(10), pady=self.get_scaled_value(3))
         self.installation_browse_button.pack(pady=self.get_scaled_value(3))
+        self.hardlink_checkbox = tk.Checkbutton(self.installation_dir_container, text="Fast link install (saves disk space)",
+                                                variable=self.use_hardlinks, font=self.regular_font,
+                                                bg=bg_color if not self.bg_image else '#1e1e1e', fg=fg_color,
+                                                selectcolor=entry_bg_color, activebackground=bg_color if not self.bg_image else '#1e1e1e',
+                                                activeforeground=fg_color, bd=0, highlightthickness=0)
+        self.hardlink_checkbox.pack(pady=self.get_scaled_value(3))
         # Pack in content_frame for now (fresh install mode)
         self.installation_dir_container.pack(pady=(0, 2))
         
@@ -3128,7 +3634,7 @@ class FalloutLondonVRInstaller:
             try:
                 import ctypes
                 drives = []
-                bitmask = ctypes.windll.kernel32.GetLogicalDrives()
+                bitmask = _kernel32.GetLogicalDrives()
                 for letter in string.ascii_uppercase:
                     if bitmask & 1:
                         drive = f"{letter}:"
@@ -3945,6 +4451,8 @@ class FalloutLondonVRInstaller:
         if path:
             try:
                 path = self.sanitize_path(path)
+                # User picked a folder again; rescan DLC rather than trusting cached results
+                self._dlc_cache.clear()
                 path_var.set(path)
                 if path_var == self.f4_path:
                     # Validate DLC path recursively
@@ -4607,8 +5115,7 @@ class FalloutLondonVRInstaller:
             self.create_progress_bar("Downgrading DLC Archives")
             
             def progress_update(value):
-                self.root.after(0, lambda v=value: self.progress.__setitem__("value", v) if self.progress.winfo_exists() else None)
-                self.root.after(0, lambda v=value: self.progress_label.config(text=f"Downgrading DLC Archives ({v:.1f}%)") if self.progress_label.winfo_exists() else None)
+                self._post_progress(value, f"Downgrading DLC Archives ({value:.1f}%)")
             
             downgrader = FalloutVRDowngrader(folon_data_dir, progress_callback=progress_update)
             success_count, downgraded_by_dlc = downgrader.downgrade_dlc_ba2_files()
@@ -4644,56 +5151,27 @@ class FalloutLondonVRInstaller:
             file_count = 0
             files_to_copy = []
 
-            # Calculate total size and build file list
-            for root, dirs, files in os.walk(src_dir):
-                # Debug: print what we're looking at
-                logging.debug(f"Walking directory: {root}")
-                logging.debug(f"Subdirectories found: {dirs}")
-                
-                # Remove F4SE directories (case insensitive)
-                original_dirs = dirs[:]
-                dirs[:] = [d for d in dirs if d.lower() != 'f4se']
-                
-                if len(dirs) != len(original_dirs):
-                    excluded = [d for d in original_dirs if d not in dirs]
-                    logging.info(f"Excluded directories: {excluded} from {root}")
-                
-                # Skip if we're currently inside an F4SE directory
-                if 'f4se' in root.lower():
-                    logging.info(f"Skipping F4SE directory: {root}")
-                    continue
-                
-                for file in files:
-                    src_file = os.path.join(root, file)
-                    rel_path = os.path.relpath(root, src_dir)
-                    
-                    if rel_path == '.':
-                        dest_file = os.path.join(dest_dir, file)
-                    else:
-                        dest_file = os.path.join(dest_dir, rel_path, file)
-
-                    try:
-                        file_size = os.path.getsize(src_file)
-                        total_size += file_size
-                        file_count += 1
-                        files_to_copy.append((src_file, dest_file, file_size))
-                    except OSError as e:
-                        logging.warning(f"Could not get size of {src_file}: {e}")
+            # Calculate total size and build file list in one scandir pass; F4SE directories
+            # (and anything under a path containing "f4se") are skipped
+            for src_file, dest_file, file_size in self._iter_copy_pairs(src_dir, dest_dir, frozenset({"f4se"}), ("f4se",)):
+                total_size += file_size
+                file_count += 1
+                files_to_copy.append((src_file, dest_file, file_size))
 
             if file_count == 0:
                 logging.warning(f"No files found to copy from {src_dir}")
                 return
 
+            self._make_dest_dirs(files_to_copy)
+
             copied_size = 0
             files_copied = 0
+            self._last_progress_update = 0.0
 
-            for src_file, dest_file, file_size in files_to_copy:
+            for index, (src_file, dest_file, file_size) in enumerate(files_to_copy, 1):
                 if self.cancel_requested:
                     raise InterruptedError("Installation cancelled by user")
 
-                dest_file_dir = os.path.dirname(dest_file)
-                os.makedirs(dest_file_dir, exist_ok=True)
-
                 try:
                     # Handle read-only files in destination
                     if os.path.exists(dest_file):
@@ -4717,10 +5195,12 @@ class FalloutLondonVRInstaller:
                         # Continue with other files instead of failing completely
                         continue
 
-                # Update progress
-                progress_percentage = (copied_size / total_size) * 100
-                self.root.after(0, lambda pp=progress_percentage: self.progress.__setitem__("value", pp))
-                self.root.after(0, lambda pp=progress_percentage: self.progress_label.config(text=f"{label_text} ({pp:.1f}%)"))
+                # Update progress at most 10 times per second (always on the last file)
+                now = time.monotonic()
+                if now - self._last_progress_update >= 0.1 or index == file_count:
+                    self._last_progress_update = now
+                    progress_percentage = (copied_size / total_size) * 100 if total_size > 0 else 0
+                    self._post_progress(progress_percentage, f"{label_text} ({progress_percentage:.1f}%)")
 
             logging.info(f"Successfully copied {files_copied} files from {src_dir} to {dest_dir}")
 
@@ -4780,37 +5260,21 @@ class FalloutLondonVRInstaller:
             # Collect all files to copy
             files_to_copy = []
             total_size = 0
-            exclude_dirs_lower = [d.lower() for d in exclude_dirs]
-            exclude_files_lower = [f.lower() for f in exclude_files]
+            exclude_dirs_lower = frozenset(d.lower() for d in exclude_dirs)
+            exclude_files_lower = frozenset(f.lower() for f in exclude_files)
             
             logging.info(f"Scanning directory for parallel copy: {src_dir}")
             if exclude_files:
                 logging.info(f"Excluding files: {exclude_files}")
             
-            for root, dirs, files in os.walk(src_dir):
-                # Remove excluded directories
-                dirs[:] = [d for d in dirs if d.lower() not in exclude_dirs_lower]
-                
-                # Skip if we're in an excluded directory
-                if any(excl.lower() in root.lower() for excl in exclude_dirs_lower):
+            for src_file, dest_file, size in self._iter_copy_pairs(src_dir, dest_dir, exclude_dirs_lower, exclude_dirs_lower):
+                # Skip excluded files
+                file = os.path.basename(src_file)
+                if file.lower() in exclude_files_lower:
+                    logging.info(f"Skipping excluded file: {file}")
                     continue
-                
-                for file in files:
-                    # Skip excluded files
-                    if file.lower() in exclude_files_lower:
-                        logging.info(f"Skipping excluded file: {file}")
-                        continue
-                    
-                    src_file = os.path.join(root, file)
-                    rel_path = os.path.relpath(src_file, src_dir)
-                    dest_file = os.path.join(dest_dir, rel_path)
-                    
-                    try:
-                        size = os.path.getsize(src_file)
-                        files_to_copy.append((src_file, dest_file, size))
-                        total_size += size
-                    except OSError as e:
-                        logging.warning(f"Could not get size of {src_file}: {e}")
+                files_to_copy.append((src_file, dest_file, size))
+                total_size += size
             
             if not files_to_copy:
                 logging.warning(f"No files to copy from {src_dir}")
@@ -4835,20 +5299,29 @@ class FalloutLondonVRInstaller:
                     raise InterruptedError("Installation cancelled by user")
                 
                 try:
-                    # Create destination directory
-                    dest_dir_path = os.path.dirname(dest_file)
-                    os.makedirs(dest_dir_path, exist_ok=True)
-                    
                     # Handle read-only files
                     if os.path.exists(dest_file):
                         self.remove_readonly_and_overwrite(dest_file)
                     
-                    # Copy file in chunks
-                    chunk_size = 4 * 1024 * 1024  # 4MB chunks
+                    if sys.platform == "win32" and size > 64 * 1024 * 1024:
+                        # Large archives go through CopyFileExW unbuffered (robocopy /J equivalent);
+                        # it also carries timestamps and attributes, so no copystat afterwards
+                        def on_bytes(delta):
+                            progress = (copied_counter.add(delta) / total_size * 100) if total_size > 0 else 0
+                            self._post_progress(progress, f"{label_text} ({progress:.1f}%)")
+                        
+                        self._copy_file_native(src_file, dest_file, size, on_bytes)
+                        return True, src_file, None
+                    
+                    # Copy file in chunks sized to installed RAM. No periodic fsync - the OS write-back
+                    # cache coalesces writes and an interrupted install simply re-copies the file
+                    chunk_size = _copy_buf_size(max_workers)
+                    ui_update_bytes = max(10 * 1024 * 1024, chunk_size * 5 // 2)  # Same cadence as 10MB per 4MB chunk
                     bytes_copied = 0
                     
                     with open(src_file, 'rb') as fsrc:
                         with open(dest_file, 'wb') as fdest:
+                            self._preallocate(fdest, size)
                             while True:
                                 chunk = fsrc.read(chunk_size)
                                 if not chunk:
@@ -4859,20 +5332,13 @@ class FalloutLondonVRInstaller:
                                 # Thread-safe progress update
                                 current_total = copied_counter.add(len(chunk))
                                 
-                                # Throttle UI updates (only update every 10MB or so)
-                                if current_total % (10 * 1024 * 1024) < chunk_size:
+                                # Publish through the coalescing channel; the main thread does the Tk work
+                                if current_total % ui_update_bytes < chunk_size:
                                     progress = (current_total / total_size * 100) if total_size > 0 else 0
-                                    if self.progress and self.progress.winfo_exists():
-                                        self.root.after(0, lambda p=progress: self.progress.__setitem__("value", p))
-                                    if self.progress_label and self.progress_label.winfo_exists():
-                                        self.root.after(0, lambda p=progress: self.progress_label.config(
-                                            text=f"{label_text} ({p:.1f}%)"
-                                        ))
-                                
-                                # For very large files, periodically flush to disk
-                                if bytes_copied % (50 * 1024 * 1024) == 0:  # Every 50MB
-                                    fdest.flush()
-                                    os.fsync(fdest.fileno())  # Force write to disk
+                                    self._post_progress(progress, f"{label_text} ({progress:.1f}%)")
+                            
+                            if bytes_copied != size:
+                                fdest.truncate()  # Source changed size; drop the preallocated tail
                     
                     # Copy file attributes
                     shutil.copystat(src_file, dest_file)
@@ -4884,6 +5350,8 @@ class FalloutLondonVRInstaller:
                         failed_files.append((src_file, str(e)))
                     return False, src_file, str(e)
             
+            self._make_dest_dirs(files_to_copy)
+            
             # Create thread pool and submit all copy tasks
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit all tasks
@@ -4893,12 +5361,12 @@ class FalloutLondonVRInstaller:
                 }
                 
                 # Monitor progress
-                last_update_time = time.time()
+                last_update_time = time.monotonic()
                 completed_count = 0
                 
                 for future in as_completed(future_to_file):
                     completed_count += 1
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     
                     try:
                         success, file_path, error = future.result()
@@ -4910,8 +5378,8 @@ class FalloutLondonVRInstaller:
                         with failed_files_lock:
                             failed_files.append((file_info[0], str(e)))
                     
-                    # Update progress every 0.5 seconds or every 10 files
-                    if current_time - last_update_time > 0.5 or completed_count % 10 == 0:
+                    # Update progress at most every 100ms regardless of how many small files complete
+                    if current_time - last_update_time >= 0.1:
                         current_copied = copied_counter.get()
                         progress = (current_copied / total_size * 100) if total_size > 0 else 0
                         progress = min(progress, 99.9)  # Cap at 99.9% until fully complete
@@ -4924,21 +5392,13 @@ class FalloutLondonVRInstaller:
                         else:
                             speed_mb = 0
                         
-                        # Update UI using direct widget updates
-                        if self.progress and self.progress.winfo_exists():
-                            self.root.after(0, lambda p=progress: self.progress.__setitem__("value", p))
-                        if self.progress_label and self.progress_label.winfo_exists():
-                            self.root.after(0, lambda p=progress, s=speed_mb: self.progress_label.config(
-                                text=f"{label_text} ({p:.1f}%)"
-                            ))
+                        # Same channel as the workers; only the newest value reaches the bar
+                        self._post_progress(progress, f"{label_text} ({progress:.1f}%)")
                         
                         last_update_time = current_time
             
-            # Final update using direct widget updates
-            if self.progress and self.progress.winfo_exists():
-                self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-            if self.progress_label and self.progress_label.winfo_exists():
-                self.root.after(0, lambda: self.progress_label.config(text=f"{label_text} (Complete)"))
+            # Workers are done, so this overwrites anything they left in the slot
+            self._post_progress(100, f"{label_text} (Complete)")
             
             # Log results
             logging.info(f"Parallel copy completed: {files_copied}/{len(files_to_copy)} files copied successfully")
@@ -4963,51 +5423,34 @@ class FalloutLondonVRInstaller:
 
     def get_directory_size(self, path, exclude_dirs=None):
         """Calculate total size of directory for progress tracking"""
-        if exclude_dirs is None:
-            exclude_dirs = []
-        
-        total_size = 0
-        exclude_dirs_lower = [d.lower() for d in exclude_dirs]
-        
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                # Remove excluded directories
-                dirnames[:] = [d for d in dirnames if d.lower() not in exclude_dirs_lower]
-                
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except OSError:
-                        pass
-            
-            logging.info(f"Directory {path} size calculated")
-        except Exception as e:
-            logging.warning(f"Error calculating directory size: {e}")
-            # Return a reasonable estimate if we can't calculate
-            return 50 * 1024 * 1024 * 1024  # 50GB estimate
-        
-        return total_size
+        return self.get_directory_size_and_count(path, exclude_dirs)[0]
 
     def get_directory_size_and_count(self, path, exclude_dirs=None):
         """Calculate total size and file count of directory for progress tracking"""
-        if exclude_dirs is None:
-            exclude_dirs = []
+        exclude_set = frozenset(d.lower() for d in exclude_dirs or ())
         
         total_size = 0
         file_count = 0
-        exclude_dirs_lower = [d.lower() for d in exclude_dirs]
         
         try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                dirnames[:] = [d for d in dirnames if d.lower() not in exclude_dirs_lower]
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                        file_count += 1
-                    except OSError:
-                        pass
+            # Explicit stack instead of os.walk; scandir entries carry their stat data on Windows
+            stack = deque([path])
+            while stack:
+                try:
+                    it = os.scandir(stack.pop())
+                except OSError:
+                    continue
+                with it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name.lower() not in exclude_set:
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                                file_count += 1
+                        except OSError:
+                            pass
             logging.info(f"Directory {path} analyzed")
         except Exception as e:
             logging.warning(f"Error calculating directory size/count: {e}")
@@ -5065,13 +5508,12 @@ class FalloutLondonVRInstaller:
                 extract_thread_obj.start()
                 
                 # Simulate progress while extraction runs
-                start_time = time.time()
+                start_time = time.monotonic()
                 while not extraction_complete.is_set():
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     progress_percent = min((elapsed / estimated_time) * 95, 95)  # Cap at 95% until complete
                     
-                    self.root.after(0, lambda p=progress_percent: self.progress.__setitem__("value", p))
-                    self.root.after(0, lambda p=progress_percent: self.progress_label.config(text=f"Extracting Fallout: London VR assets ({p:.0f}%)"))
+                    self._post_progress(progress_percent, f"Extracting Fallout: London VR assets ({progress_percent:.0f}%)")
                     
                     time.sleep(0.1)  # Update every 100ms
                 
@@ -5083,8 +5525,7 @@ class FalloutLondonVRInstaller:
                     raise extraction_error
                 
                 # Set to 100% complete
-                self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-                self.root.after(0, lambda: self.progress_label.config(text="Extracting Fallout: London VR Assets (100%)"))
+                self._post_progress(100, "Extracting Fallout: London VR Assets (100%)")
                 
                 logging.info(f"Extracted MO2 assets from {mo2_assets_archive} to {temp_dir}")
                 
@@ -5196,26 +5637,44 @@ class FalloutLondonVRInstaller:
                 330553163: "322,806 KB (variant)"
             }
             size_tolerance = 1000  # Allow ±1000 bytes for size matching
-            for src_dir in [self.f4_path.get(), os.path.join(self.london_data_path.get(), "Data") if self.london_data_path.get() else None, self.london_data_path.get() if self.london_data_path.get() else None, os.path.join(self.f4vr_path.get(), "Data")]:
-                if src_dir and os.path.exists(src_dir):
-                    src_esm = os.path.join(src_dir, "Fallout4.esm")
-                    if os.path.exists(src_esm):
-                        esm_size = os.path.getsize(src_esm)
-                        # Check if size is within tolerance of expected sizes
-                        for expected_size, size_name in expected_esm_sizes.items():
-                            if abs(esm_size - expected_size) <= size_tolerance:
-                                dest_esm = os.path.join(london_mod_dir, "Fallout4.esm")
-                                try:
-                                    if os.path.exists(dest_esm):
-                                        self.remove_readonly_and_overwrite(dest_esm)
-                                    shutil.copy2(src_esm, dest_esm)
-                                    logging.info(f"Copied Fallout4.esm from {src_dir} to {london_mod_dir} (size: {esm_size:,} bytes, {esm_size/(1024*1024):.2f} MB)")
-                                    esm_copied = True
-                                    break
-                                except Exception as e:
-                                    logging.warning(f"Failed to copy Fallout4.esm from {src_dir}: {e}")
-                        if esm_copied:
-                            break
+            expected_sizes_sorted = sorted(expected_esm_sizes)
+
+            def matches_expected_size(esm_size):
+                # Only the nearest expected sizes on either side can be within tolerance
+                idx = bisect.bisect_left(expected_sizes_sorted, esm_size)
+                for neighbor in expected_sizes_sorted[max(idx - 1, 0):idx + 1]:
+                    if abs(esm_size - neighbor) <= size_tolerance:
+                        return True
+                return False
+
+            # Candidate sources in order of preference: F4, London Data, London root, F4VR Data
+            f4 = self.f4_path.get()
+            london_path = self.london_data_path.get()
+            f4vr = self.f4vr_path.get()
+            esm_sources = [f4]
+            if london_path:
+                esm_sources += [os.path.join(london_path, "Data"), london_path]
+            esm_sources.append(os.path.join(f4vr, "Data"))
+
+            dest_esm = os.path.join(london_mod_dir, "Fallout4.esm")
+            for src_dir in esm_sources:
+                if not src_dir:
+                    continue
+                src_esm = os.path.join(src_dir, "Fallout4.esm")
+                try:
+                    esm_size = os.path.getsize(src_esm)
+                except OSError:
+                    continue
+                if not matches_expected_size(esm_size):
+                    continue
+                try:
+                    # The ESM patcher replaces the file (never writes in place), so linking is safe
+                    self._install_file(src_esm, dest_esm)
+                    logging.info(f"Copied Fallout4.esm from {src_dir} to {london_mod_dir} (size: {esm_size:,} bytes, {esm_size/(1024*1024):.2f} MB)")
+                    esm_copied = True
+                    break
+                except Exception as e:
+                    logging.warning(f"Failed to copy Fallout4.esm from {src_dir}: {e}")
             if not esm_copied:
                 self.root.after(0, lambda: self.message_label.config(
                     text="No valid Fallout4.esm found in any source path.", fg="#ff6666"
@@ -5249,119 +5708,109 @@ class FalloutLondonVRInstaller:
         try:
             src_data_dir = os.path.join(f4_path, "Data")
             
-            # Define London-specific file patterns
-            london_patterns = [
-                "London*.esm",
-                "London*.esp",
-                "London*.ba2",
-                "LondonWorldSpace*",
-                "FOLON*"
-            ]
-            
             # Define directories to exclude
             exclude_dirs = ["f4se", "F4SE"]
+            exclude_lower = frozenset(e.lower() for e in exclude_dirs)
             
             # Build list of files to copy
             files_to_copy = []
             total_size = 0
             
-            # Copy files matching London patterns from Data root
-            for pattern in london_patterns:
-                for file_path in Path(src_data_dir).glob(pattern):
+            # Copy files matching London patterns from Data root (single directory pass)
+            with os.scandir(src_data_dir) as it:
+                for entry in it:
+                    if not LONDON_FILE_PATTERN.match(entry.name):
+                        continue
                     try:
-                        size = file_path.stat().st_size
-                        files_to_copy.append((str(file_path), file_path.name, size))
+                        if not entry.is_file():
+                            continue
+                        size = entry.stat().st_size
+                        files_to_copy.append((entry.path, os.path.join(dest_dir, entry.name), size))
                         total_size += size
                     except OSError as e:
-                        logging.warning(f"Could not get size of {file_path}: {e}")
-            
-            # Copy all files from Video subdirectory (excluding F4SE)
-            video_dir = os.path.join(src_data_dir, "Video")
-            if os.path.exists(video_dir):
-                for root, dirs, files in os.walk(video_dir):
-                    # Exclude F4SE directories
-                    dirs[:] = [d for d in dirs if d.lower() not in [e.lower() for e in exclude_dirs]]
-                    for file in files:
-                        src_file = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_file, src_data_dir)
-                        try:
-                            size = os.path.getsize(src_file)
-                            files_to_copy.append((src_file, rel_path, size))
-                            total_size += size
-                        except OSError as e:
-                            logging.warning(f"Could not get size of {src_file}: {e}")
-            
-            # Copy all files from Scripts subdirectory (excluding F4SE)
-            scripts_dir = os.path.join(src_data_dir, "Scripts")
-            if os.path.exists(scripts_dir):
-                for root, dirs, files in os.walk(scripts_dir):
-                    # Exclude F4SE directories
-                    dirs[:] = [d for d in dirs if d.lower() not in [e.lower() for e in exclude_dirs]]
-                    for file in files:
-                        src_file = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_file, src_data_dir)
-                        try:
-                            size = os.path.getsize(src_file)
-                            files_to_copy.append((src_file, rel_path, size))
-                            total_size += size
-                        except OSError as e:
-                            logging.warning(f"Could not get size of {src_file}: {e}")
-            
-            # Copy all files from Textures subdirectory (excluding F4SE)
-            textures_dir = os.path.join(src_data_dir, "Textures")
-            if os.path.exists(textures_dir):
-                for root, dirs, files in os.walk(textures_dir):
-                    # Exclude F4SE directories
-                    dirs[:] = [d for d in dirs if d.lower() not in [e.lower() for e in exclude_dirs]]
-                    for file in files:
-                        src_file = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_file, src_data_dir)
-                        try:
-                            size = os.path.getsize(src_file)
-                            files_to_copy.append((src_file, rel_path, size))
-                            total_size += size
-                        except OSError as e:
-                            logging.warning(f"Could not get size of {src_file}: {e}")
+                        logging.warning(f"Could not get size of {entry.path}: {e}")
+            
+            # Copy all files from the Video, Scripts and Textures subdirectories (excluding F4SE)
+            for subdir_name in ("Video", "Scripts", "Textures"):
+                total_size += self._collect_subtree(src_data_dir, dest_dir, subdir_name, exclude_lower, files_to_copy)
             
             logging.info(f"Found {len(files_to_copy)} London-specific files to copy, total size: {total_size / (1024**3):.2f} GB")
             
+            # Destination paths are resolved during the scan, so the copy workers do no path work per file
+            self._make_dest_dirs(files_to_copy)
+            
+            # Largest files first (LPT scheduling) so multi-GB archives are in flight early
+            # and small files fill the remaining time instead of a big BA2 finishing last
+            files_to_copy.sort(key=lambda t: -t[2])
+            huge_file_threshold = 512 * 1024 * 1024
+            
+            def copy_single_london_file(file_info):
+                src_file, dest_file, size = file_info
+                if self.cancel_requested:
+                    raise InterruptedError("Installation cancelled by user")
+                # Destination directories were created above
+                self._install_file(src_file, dest_file)
+                return size
+            
             # Copy the files with progress
             self.create_progress_bar("Copying Fallout: London Data")
             copied_size = 0
+            self._last_progress_update = 0.0
             
-            for src_file, rel_path, size in files_to_copy:
-                if self.cancel_requested:
-                    raise InterruptedError("Installation cancelled by user")
-                
-                # Determine destination path
-                if os.path.sep in rel_path:
-                    dest_file = os.path.join(dest_dir, rel_path)
-                    os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-                else:
-                    dest_file = os.path.join(dest_dir, rel_path)
+            # Huge archives get one dedicated worker to avoid thrashing the disk;
+            # small files use a wider pool where latency hiding helps
+            with ThreadPoolExecutor(max_workers=1) as huge_executor, ThreadPoolExecutor(max_workers=8) as small_executor:
+                future_to_file = {
+                    (huge_executor if file_info[2] > huge_file_threshold else small_executor).submit(copy_single_london_file, file_info): file_info
+                    for file_info in files_to_copy
+                }
+                remaining = len(future_to_file)
                 
-                # Copy file
-                try:
-                    if os.path.exists(dest_file):
-                        self.remove_readonly_and_overwrite(dest_file)
-                    shutil.copy2(src_file, dest_file)
-                    copied_size += size
+                for future in as_completed(future_to_file):
+                    remaining -= 1
+                    try:
+                        copied_size += future.result()
+                    except InterruptedError:
+                        raise
+                    except Exception as e:
+                        logging.error(f"Failed to copy {future_to_file[future][0]}: {e}")
+                        continue
                     
-                    # Update progress
-                    progress = (copied_size / total_size * 100) if total_size > 0 else 0
-                    self.root.after(0, lambda p=progress: self.progress.__setitem__("value", p))
-                    self.root.after(0, lambda p=progress: self.progress_label.config(
-                        text=f"Copying Fallout: London Data ({p:.1f}%)"
-                    ))
-                except Exception as e:
-                    logging.error(f"Failed to copy {src_file}: {e}")
+                    # Update progress at most 10 times per second (always on the last file)
+                    now = time.monotonic()
+                    if now - self._last_progress_update >= 0.1 or remaining == 0:
+                        self._last_progress_update = now
+                        progress = (copied_size / total_size * 100) if total_size > 0 else 0
+                        self._post_progress(progress, f"Copying Fallout: London Data ({progress:.1f}%)")
             
         except Exception as e:
             logging.error(f"Failed to copy London files: {e}")
             raise
 
+    def _collect_subtree(self, src_data_dir, dest_dir, subdir, exclude_lower, out_list):
+        """Append (src_file, dest_file, size) for every file under src_data_dir/subdir to out_list.
+
+        dest_file mirrors the path under dest_dir. Returns the total size of the files added.
+        """
+        subtree_dir = os.path.join(src_data_dir, subdir)
+        if not os.path.isdir(subtree_dir):
+            return 0
+        subtree_size = 0
+        for file_info in self._iter_copy_pairs(subtree_dir, os.path.join(dest_dir, subdir), exclude_lower):
+            out_list.append(file_info)
+            subtree_size += file_info[2]
+        return subtree_size
+
     def detect_dlc_in_both_games(self):
         """Detect DLC in Fallout 4 and Fallout 4 VR - only check root and Data folders"""
+        # Filesystem state doesn't change between checks in one session; reuse the scan per path set
+        f4 = self.f4_path.get()
+        london = self.london_data_path.get()
+        f4vr = self.f4vr_path.get()
+        cache_key = (f4, london, f4vr)
+        if cache_key in self._dlc_cache:
+            return copy.deepcopy(self._dlc_cache[cache_key])
+        
         dlc_info = {
             "Automatron": {
                 "esm": "DLCRobot.esm",
@@ -5414,7 +5863,7 @@ class FalloutLondonVRInstaller:
         }
         
         # Check Fallout 4 DLC path (check root and Data subfolder only)
-        f4_dlc_dir = Path(self.f4_path.get())
+        f4_dlc_dir = Path(f4)
         if f4_dlc_dir.exists():
             # Check root directory
             self._scan_single_directory_for_dlc(f4_dlc_dir, dlc_info, "Fallout 4 DLC")
@@ -5425,14 +5874,14 @@ class FalloutLondonVRInstaller:
                 self._scan_single_directory_for_dlc(f4_data_dir, dlc_info, "Fallout 4 DLC")
         
         # Check Fallout 4 VR Data folder only
-        if self.f4vr_path.get():
-            f4vr_data_dir = Path(self.f4vr_path.get()) / "Data"
+        if f4vr:
+            f4vr_data_dir = Path(f4vr) / "Data"
             if f4vr_data_dir.exists():
                 self._scan_single_directory_for_dlc(f4vr_data_dir, dlc_info, "Fallout 4 VR")
         
         # Check Fallout London path (check root and Data subfolder)
-        if self.london_data_path.get() and self.london_data_path.get() not in ["", "Waiting for Fallout 4 path", "Already installed"]:
-            london_dir = Path(self.london_data_path.get())
+        if london and london not in ["", "Waiting for Fallout 4 path", "Already installed"]:
+            london_dir = Path(london)
             if london_dir.exists():
                 # Check root directory
                 self._scan_single_directory_for_dlc(london_dir, dlc_info, "Fallout London")
@@ -5442,6 +5891,7 @@ class FalloutLondonVRInstaller:
                 if london_data_dir.exists():
                     self._scan_single_directory_for_dlc(london_data_dir, dlc_info, "Fallout London")
         
+        self._dlc_cache[cache_key] = copy.deepcopy(dlc_info)
         return dlc_info
 
     def _scan_single_directory_for_dlc(self, directory, dlc_info, source_name):
@@ -5470,7 +5920,7 @@ class FalloutLondonVRInstaller:
             # Match DLC files
             for dlc_name, dlc_data in dlc_info.items():
                 if dlc_data["esm"] in esm_map:
-                    esm_path = esm_map[dlc_data["esm"]]
+                    esm_path = os.fspath(esm_map[dlc_data["esm"]])
                     is_ng = False
                     ba2_paths = []
                     
@@ -5478,7 +5928,8 @@ class FalloutLondonVRInstaller:
                     for prefix in dlc_data["ba2_prefixes"]:
                         if prefix in ba2_map:
                             for ba2_path in ba2_map[prefix]:
-                                ba2_paths.append(ba2_path)
+                                # Store plain (path, name) strings so the copy loop needs no Path conversions
+                                ba2_paths.append((os.fspath(ba2_path), ba2_path.name))
                                 # Check if Next-Gen
                                 header = BA2Header.from_file(ba2_path)
                                 if header and header.version in [ArchiveVersionEnum.FALLOUT_4_NG, ArchiveVersionEnum.FALLOUT_4_NG2]:
@@ -5512,28 +5963,30 @@ class FalloutLondonVRInstaller:
     def check_dlc_status_independent(self):
         """Check DLC status in provided paths - only root and Data folders"""
         try:
+            f4 = self.f4_path.get()
+            f4vr = self.f4vr_path.get()
+            london_path_value = self.london_data_path.get()
             data_dirs_to_check = []
             dlc_found_in_london_or_vr = False  # Track if DLC found in London or VR paths
             
             # Fallout 4 DLC path - check if it has a value (auto-detected or user-selected)
             # We need to check this path regardless of widget visibility since it may be auto-detected
             f4_dirs = []
-            if self.f4_path.get() and os.path.exists(self.f4_path.get()):
-                f4_dirs.append(("Fallout 4 DLC", self.f4_path.get()))
-                f4_data = os.path.join(self.f4_path.get(), "Data")
+            if f4 and os.path.exists(f4):
+                f4_dirs.append(("Fallout 4 DLC", f4))
+                f4_data = os.path.join(f4, "Data")
                 if os.path.exists(f4_data):
                     f4_dirs.append(("Fallout 4 DLC", f4_data))
             
             # Fallout 4 VR Data folder only
             vr_dirs = []
-            if self.f4vr_path.get() and os.path.exists(self.f4vr_path.get()):
-                f4vr_data = os.path.join(self.f4vr_path.get(), "Data")
+            if f4vr and os.path.exists(f4vr):
+                f4vr_data = os.path.join(f4vr, "Data")
                 if os.path.exists(f4vr_data):
                     vr_dirs.append(("Fallout 4 VR", f4vr_data))
             
             # Fallout London path - check root and Data
             london_dirs = []
-            london_path_value = self.london_data_path.get()
             if london_path_value and london_path_value not in ["", "Waiting for Fallout 4 path", "Already installed"] and os.path.exists(london_path_value):
                 london_dirs.append(("Fallout London", london_path_value))
                 london_data = os.path.join(london_path_value, "Data")
@@ -5564,19 +6017,21 @@ class FalloutLondonVRInstaller:
             
             found_dlc = {}
             missing_dlc = []
+            required_esm_lower = {esm_file.lower(): dlc_name for dlc_name, esm_file in required_dlc.items()}
             
             # Check each directory (non-recursive)
             for game_name, dir_path in data_dirs_to_check:
                 try:
-                    files = {f.lower(): f for f in os.listdir(dir_path) if os.path.isfile(os.path.join(dir_path, f)) and f.lower().endswith('.esm')}
-                    for dlc_name, esm_file in required_dlc.items():
-                        if esm_file.lower() in files:
-                            if dlc_name not in found_dlc:
-                                found_dlc[dlc_name] = game_name
-                                logging.info(f"Found {dlc_name} ({esm_file}) in {dir_path}")
-                                # Track if found in London or VR (not F4 DLC path)
-                                if game_name in ["Fallout London", "Fallout 4 VR"]:
-                                    dlc_found_in_london_or_vr = True
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            dlc_name = required_esm_lower.get(entry.name.lower())
+                            if dlc_name is None or dlc_name in found_dlc or not entry.is_file():
+                                continue
+                            found_dlc[dlc_name] = game_name
+                            logging.info(f"Found {dlc_name} ({required_dlc[dlc_name]}) in {dir_path}")
+                            # Track if found in London or VR (not F4 DLC path)
+                            if game_name in ["Fallout London", "Fallout 4 VR"]:
+                                dlc_found_in_london_or_vr = True
                 except Exception as e:
                     logging.error(f"Error checking directory {dir_path}: {e}")
                     self.root.after(0, lambda: self.message_label.config(
@@ -5591,7 +6046,7 @@ class FalloutLondonVRInstaller:
             # Determine if we need to show F4 DLC widgets
             # Show if: DLC is missing AND not found in London path
             london_valid = london_path_value and london_path_value not in ["", "Waiting for Fallout 4 path", "Already installed"] and os.path.exists(london_path_value)
-            vr_valid = self.f4vr_path.get() and os.path.exists(self.f4vr_path.get()) and os.path.exists(os.path.join(self.f4vr_path.get(), "Fallout4VR.exe"))
+            vr_valid = f4vr and os.path.exists(f4vr) and os.path.exists(os.path.join(f4vr, "Fallout4VR.exe"))
             
             # Check if ALL DLC was found in London path specifically
             all_dlc_in_london = all(found_dlc.get(dlc) == "Fallout London" for dlc in required_dlc if dlc in found_dlc) and len(found_dlc) == len(required_dlc)
@@ -5615,8 +6070,8 @@ class FalloutLondonVRInstaller:
                 
                 # Check if Fallout4.esm needs patching
                 esm_needs_patch = False
-                if self.f4_path.get():
-                    esm_needs_patch, esm_size = self.check_fallout4_esm_size(self.f4_path.get())
+                if f4:
+                    esm_needs_patch, esm_size = self.check_fallout4_esm_size(f4)
                 
                 if esm_needs_patch:
                     logging.info(f"Fallout4.esm needs patching (size: {esm_size:,} bytes)")
@@ -5639,7 +6094,7 @@ class FalloutLondonVRInstaller:
                 elif all_dlc_in_london_or_vr:
                     # All DLC found in London or VR paths - hide F4 DLC widgets
                     self.root.after(0, self.hide_f4_dlc_widgets)
-                elif self.f4_path.get() and london_valid and vr_valid:
+                elif f4 and london_valid and vr_valid:
                     # DLC found in F4 path - show widgets with the auto-detected path
                     self.root.after(0, self.show_f4_dlc_widgets)
                 else:
@@ -5699,23 +6154,24 @@ class FalloutLondonVRInstaller:
             if dlc_data["found_in"]:
                 files_to_copy = []
                 if dlc_data["esm_path"]:
-                    files_to_copy.append(dlc_data["esm_path"])
+                    files_to_copy.append((dlc_data["esm_path"], dlc_data["esm"]))
                 files_to_copy.extend(dlc_data["ba2_paths"])
                 
                 logging.info(f"Copying {dlc_name} from {dlc_data['found_in']} (Pre-NG: {not dlc_data['is_next_gen']})")
+                # Next-Gen BA2s are downgraded in place later, so they must not share data with the source
+                allow_link = not dlc_data["is_next_gen"]
                 
-                for file_path in files_to_copy:
-                    dest_file = os.path.join(dest_dir, file_path.name)  # Copy to root of dest_dir
+                for file_path, file_name in files_to_copy:
+                    dest_file = os.path.join(dest_dir, file_name)  # Copy to root of dest_dir
                     try:
-                        shutil.copy2(str(file_path), dest_file)
-                        logging.debug(f"Copied {file_path.name} from {dlc_data['found_in']}")
+                        self._install_file(file_path, dest_file, allow_link=allow_link)
+                        logging.debug(f"Copied {file_name} from {dlc_data['found_in']}")
                     except Exception as e:
                         logging.error(f"Failed to copy {file_path}: {e}")
                 
                 processed_dlc += 1
                 progress = (processed_dlc / total_dlc) * 100
-                self.root.after(0, lambda p=progress: self.progress.__setitem__("value", p))
-                self.root.after(0, lambda p=progress, n=dlc_name: self.progress_label.config(text=f"Copying DLC: {n} ({p:.0f}%)"))
+                self._post_progress(progress, f"Copying DLC: {dlc_name} ({progress:.0f}%)")
 
     def copy_directory_with_file_exclusions(self, src_dir, dest_dir, label_text, exclude_dirs=None, exclude_files=None):
         """Copy directory with file exclusions using parallel method"""
@@ -5727,7 +6183,7 @@ class FalloutLondonVRInstaller:
         # Convert to parallel copy with exclusions
         return self.copy_directory_parallel_with_exclusions(src_dir, dest_dir, label_text, exclude_dirs, exclude_files)
 
-    def copy_directory_parallel_with_exclusions(self, src_dir, dest_dir, label_text, exclude_dirs=None, exclude_files=None, max_workers=8):
+    def copy_directory_parallel_with_exclusions(self, src_dir, dest_dir, label_text, exclude_dirs=None, exclude_files=None, max_workers=None):
         """Parallel copy with file exclusions"""
         if exclude_dirs is None:
             exclude_dirs = ["F4SE", "source", "scripts\\source"]
@@ -5744,35 +6200,18 @@ class FalloutLondonVRInstaller:
             # Collect all files to copy
             files_to_copy = []
             total_size = 0
-            exclude_dirs_lower = [d.lower() for d in exclude_dirs]
+            exclude_dirs_lower = frozenset(d.lower() for d in exclude_dirs)
             exclude_files_set = set(exclude_files)  # Convert to set for faster lookup
             
             logging.info(f"Scanning directory for parallel copy with exclusions: {src_dir}")
             logging.info(f"Excluding files: {exclude_files[:10]}..." if len(exclude_files) > 10 else f"Excluding files: {exclude_files}")
             
-            for root, dirs, files in os.walk(src_dir):
-                # Remove excluded directories
-                dirs[:] = [d for d in dirs if d.lower() not in exclude_dirs_lower]
-                
-                # Skip if we're in an excluded directory
-                if any(excl.lower() in root.lower() for excl in exclude_dirs_lower):
+            for src_file, dest_file, size in self._iter_copy_pairs(src_dir, dest_dir, exclude_dirs_lower, exclude_dirs_lower):
+                # Skip excluded files
+                if os.path.basename(src_file) in exclude_files_set:
                     continue
-                
-                for file in files:
-                    # Skip excluded files
-                    if file in exclude_files_set:
-                        continue
-                        
-                    src_file = os.path.join(root, file)
-                    rel_path = os.path.relpath(src_file, src_dir)
-                    dest_file = os.path.join(dest_dir, rel_path)
-                    
-                    try:
-                        size = os.path.getsize(src_file)
-                        files_to_copy.append((src_file, dest_file, size))
-                        total_size += size
-                    except OSError as e:
-                        logging.warning(f"Could not get size of {src_file}: {e}")
+                files_to_copy.append((src_file, dest_file, size))
+                total_size += size
             
             if not files_to_copy:
                 logging.warning(f"No files to copy from {src_dir}")
@@ -5780,13 +6219,21 @@ class FalloutLondonVRInstaller:
             
             logging.info(f"Found {len(files_to_copy)} files to copy (after exclusions), total size: {total_size / (1024**3):.2f} GB")
             
-            # Sort by size - copy small files first for better responsiveness
-            files_to_copy.sort(key=lambda x: x[2])
+            if self._is_rotational_drive(src_dir) or self._is_rotational_drive(dest_dir):
+                # HDD: keep each directory together (largest first within it) and limit head contention
+                files_to_copy.sort(key=lambda x: (os.path.dirname(x[0]), -x[2]))
+            else:
+                # SSD: largest first (LPT) so workers finish together instead of queuing big files at the end
+                files_to_copy.sort(key=lambda x: x[2], reverse=True)
+            
+            if max_workers is None:
+                # Match concurrency to the slower device's parallelism (HDD 2, SATA SSD 8, NVMe 16)
+                max_workers = min(self._detect_storage_workers(src_dir), self._detect_storage_workers(dest_dir))
+                logging.info(f"Storage-based worker count: {max_workers}")
             
             # Thread-safe progress tracking
             copied_counter = ThreadSafeCounter(0)
-            failed_files = []
-            failed_files_lock = threading.Lock()
+            failed_files = []  # Only touched by the single-threaded as_completed loop
             files_copied = 0
             
             def copy_single_file_safe_exclusions(file_info):
@@ -5797,55 +6244,56 @@ class FalloutLondonVRInstaller:
                     raise InterruptedError("Installation cancelled by user")
                 
                 try:
-                    # Create destination directory
-                    dest_dir_path = os.path.dirname(dest_file)
-                    os.makedirs(dest_dir_path, exist_ok=True)
+                    if self.update_mode:
+                        # Files left by the previous install with matching size and mtime are unchanged
+                        try:
+                            dest_stat = os.stat(dest_file)
+                            if dest_stat.st_size == size and int(dest_stat.st_mtime) == int(os.stat(src_file).st_mtime):
+                                copied_counter.add(size)
+                                return True, src_file, None
+                        except OSError:
+                            pass
+                    
+                    # Hard link / block clone when possible; DLC BA2s may be downgraded in place later
+                    name_lower = os.path.basename(src_file).lower()
+                    allow_link = not (name_lower.startswith("dlc") and name_lower.endswith(".ba2"))
+                    if self._try_clone_or_link(src_file, dest_file, allow_link):
+                        copied_counter.add(size)
+                        return True, src_file, None
                     
                     # Handle read-only files
                     if os.path.exists(dest_file):
                         self.remove_readonly_and_overwrite(dest_file)
                     
-                    # Copy file in chunks
-                    chunk_size = 4 * 1024 * 1024  # 4MB chunks
-                    bytes_copied = 0
+                    pending_bytes = 0
                     
-                    with open(src_file, 'rb') as fsrc:
-                        with open(dest_file, 'wb') as fdest:
-                            while True:
-                                chunk = fsrc.read(chunk_size)
-                                if not chunk:
-                                    break
-                                fdest.write(chunk)
-                                bytes_copied += len(chunk)
-                                
-                                # Thread-safe progress update
-                                current_total = copied_counter.add(len(chunk))
-                                
-                                # Throttle UI updates (only update every 10MB or so)
-                                if current_total % (10 * 1024 * 1024) < chunk_size:
-                                    progress = (current_total / total_size * 100) if total_size > 0 else 0
-                                    if self.progress and self.progress.winfo_exists():
-                                        self.root.after(0, lambda p=progress: self.progress.__setitem__("value", p))
-                                    if self.progress_label and self.progress_label.winfo_exists():
-                                        self.root.after(0, lambda p=progress: self.progress_label.config(
-                                            text=f"{label_text} ({p:.1f}%)"
-                                        ))
-                                
-                                # For very large files, periodically flush to disk
-                                if bytes_copied % (50 * 1024 * 1024) == 0:  # Every 50MB
-                                    fdest.flush()
-                                    os.fsync(fdest.fileno())  # Force write to disk
+                    def on_bytes(delta):
+                        # Accumulate locally and publish to the shared counter every 64MB
+                        nonlocal pending_bytes
+                        pending_bytes += delta
+                        if pending_bytes >= 64 * 1024 * 1024:
+                            progress = min(copied_counter.add(pending_bytes) / total_size * 100, 99.9)
+                            pending_bytes = 0
+                            # Coalesced with every other post; the flush runs on the main thread
+                            self._post_progress(progress, f"{label_text} ({progress:.1f}%)")
                     
-                    # Copy file attributes
-                    shutil.copystat(src_file, dest_file)
+                    # Kernel-side copy with a progress routine feeding the shared counter
+                    self._copy_file_native(src_file, dest_file, size, on_bytes)
+                    
+                    if pending_bytes:
+                        copied_counter.add(pending_bytes)
+                    
+                    # CopyFileExW already carries attributes and timestamps, so no copystat
                     return True, src_file, None
                     
+                except InterruptedError:
+                    raise
                 except Exception as e:
                     logging.error(f"Failed to copy {src_file}: {e}")
-                    with failed_files_lock:
-                        failed_files.append((src_file, str(e)))
                     return False, src_file, str(e)
             
+            self._make_dest_dirs(files_to_copy)
+            
             # Create thread pool and submit all copy tasks
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit all tasks
@@ -5855,12 +6303,12 @@ class FalloutLondonVRInstaller:
                 }
                 
                 # Monitor progress
-                last_update_time = time.time()
+                last_update_time = time.monotonic()
                 completed_count = 0
                 
                 for future in as_completed(future_to_file):
                     completed_count += 1
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     
                     try:
                         success, file_path, error = future.result()
@@ -5870,30 +6318,21 @@ class FalloutLondonVRInstaller:
                             failed_files.append((file_path, error))
                     except Exception as e:
                         file_info = future_to_file[future]
-                        with failed_files_lock:
-                            failed_files.append((file_info[0], str(e)))
+                        failed_files.append((file_info[0], str(e)))
                     
-                    # Update progress every 0.5 seconds or every 10 files
-                    if current_time - last_update_time > 0.5 or completed_count % 10 == 0:
+                    # Update progress at most every 100ms regardless of how many small files complete
+                    if current_time - last_update_time >= 0.1:
                         current_copied = copied_counter.get()
                         progress = (current_copied / total_size * 100) if total_size > 0 else 0
                         progress = min(progress, 99.9)  # Cap at 99.9% until fully complete
                         
-                        # Update UI (no speed display for file exclusions to keep it simple)
-                        if self.progress and self.progress.winfo_exists():
-                            self.root.after(0, lambda p=progress: self.progress.__setitem__("value", p))
-                        if self.progress_label and self.progress_label.winfo_exists():
-                            self.root.after(0, lambda p=progress: self.progress_label.config(
-                                text=f"{label_text} ({p:.1f}%)"
-                            ))
+                        # Post progress (no speed display for file exclusions to keep it simple)
+                        self._post_progress(progress, f"{label_text} ({progress:.1f}%)")
                         
                         last_update_time = current_time
             
-            # Final update using direct widget updates
-            if self.progress and self.progress.winfo_exists():
-                self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-            if self.progress_label and self.progress_label.winfo_exists():
-                self.root.after(0, lambda: self.progress_label.config(text=f"{label_text} (Complete)"))
+            # Final update
+            self._post_progress(100, f"{label_text} (Complete)")
             
             # Log results
             logging.info(f"Parallel copy with exclusions completed: {files_copied}/{len(files_to_copy)} files copied successfully")
@@ -5948,9 +6387,10 @@ class FalloutLondonVRInstaller:
                     configfile.write("[General]\ngameName=Fallout 4 VR\n")
                 logging.info(f"Created new ModOrganizer.ini at {mo2_ini_path}")
             
-            # Read the configuration
-            config = configparser.ConfigParser()
-            config.read(mo2_ini_path, encoding='utf-8')
+            # Read the configuration as text; only the keys below are patched, everything else is kept byte-for-byte
+            with open(mo2_ini_path, 'rb') as configfile:
+                ini_text = configfile.read().decode('utf-8', errors='surrogateescape')
+            newline = '\r\n' if '\r\n' in ini_text else '\n'
             # Convert paths to forward slashes for MO2
             f4vr_path_forward = f4vr_path.replace('\\', '/')
             mo2_path_forward = mo2_path.replace('\\', '/')
@@ -5958,45 +6398,70 @@ class FalloutLondonVRInstaller:
             logging.info(f"Updating MO2 configuration: F4VR={f4vr_path_forward}, MO2={mo2_path_forward}")
             
             # Update [General] section
-            if 'General' not in config:
-                config['General'] = {}
-            config['General']['gamePath'] = f4vr_path_forward
-            config['General']['baseDirectory'] = mo2_path_forward
+            ini_text = self._patch_ini_section(ini_text, 'General', {
+                'gamePath': f4vr_path_forward,
+                'baseDirectory': mo2_path_forward,
+            }, newline)
             
             logging.info(f"Set gamePath to: {f4vr_path_forward}")
             logging.info(f"Set baseDirectory to: {mo2_path_forward}")
             
             # Update [customExecutables] section paths
-            if 'customExecutables' not in config:
-                config['customExecutables'] = {}
-            # Always set Fallout 4 VR executable paths and title
-            config['customExecutables']['1\\title'] = "Fallout 4 VR"  # Match the moshortcut name
-            config['customExecutables']['1\\binary'] = f"{f4vr_path_forward}/f4sevr_loader.exe"
-            config['customExecutables']['1\\workingDirectory'] = f4vr_path_forward
+            ini_text = self._patch_ini_section(ini_text, 'customExecutables', {
+                # Always set Fallout 4 VR executable paths and title
+                '1\\title': "Fallout 4 VR",  # Match the moshortcut name
+                '1\\binary': f"{f4vr_path_forward}/f4sevr_loader.exe",
+                '1\\workingDirectory': f4vr_path_forward,
+                # Always set Explorer++ paths and title
+                '2\\title': "Explorer++",
+                '2\\binary': f"{mo2_path_forward}/explorer++/Explorer++.exe",
+                '2\\arguments': f'"{f4vr_path_forward}/data"',
+                '2\\workingDirectory': f"{mo2_path_forward}/explorer++",
+            }, newline)
             
             logging.info(f"Set 1\\title to: Fallout 4 VR")
             logging.info(f"Set 1\\binary to: {f4vr_path_forward}/f4sevr_loader.exe")
             logging.info(f"Set 1\\workingDirectory to: {f4vr_path_forward}")
-            
-            # Always set Explorer++ paths and title
-            config['customExecutables']['2\\title'] = "Explorer++"  # Add this line
-            config['customExecutables']['2\\binary'] = f"{mo2_path_forward}/explorer++/Explorer++.exe"
-            config['customExecutables']['2\\arguments'] = f'"{f4vr_path_forward}/data"'
-            config['customExecutables']['2\\workingDirectory'] = f"{mo2_path_forward}/explorer++"
-            
             logging.info(f"Set 2\\title to: Explorer++")
             logging.info(f"Set 2\\binary to: {mo2_path_forward}/explorer++/Explorer++.exe")
             logging.info(f"Set 2\\workingDirectory to: {mo2_path_forward}/explorer++")
             
             # Write the updated configuration
-            with open(mo2_ini_path, 'w', encoding='utf-8') as configfile:
-                config.write(configfile)
+            with open(mo2_ini_path, 'wb') as configfile:
+                configfile.write(ini_text.encode('utf-8', errors='surrogateescape'))
             logging.info(f"Successfully updated MO2 configuration file: {mo2_ini_path}")
            
         except Exception as e:
             logging.error(f"Failed to update MO2 configuration: {e}")
             # Don't raise - this is not critical for installation
 
+    def _patch_ini_section(self, text, section, values, newline='\n'):
+        """Set key=value lines inside [section] of INI text, adding the section or missing keys"""
+        header = re.search(r'^\[' + re.escape(section) + r'\][ \t]*\r?$', text, re.M | re.I)
+        if not header:
+            if text and not text.endswith('\n'):
+                text += newline
+            return text + f"[{section}]{newline}" + "".join(f"{key}={value}{newline}" for key, value in values.items())
+
+        body_start = text.find('\n', header.end())
+        if body_start == -1:
+            text += newline
+            body_start = len(text)
+        else:
+            body_start += 1
+        next_header = re.compile(r'^\[', re.M).search(text, body_start)
+        body_end = next_header.start() if next_header else len(text)
+        body = text[body_start:body_end]
+
+        missing = []
+        for key, value in values.items():
+            # Keys are matched case-insensitively since earlier configparser writes lowercased them
+            line = re.compile(r'^' + re.escape(key) + r'[ \t]*=.*?(?=\r?$)', re.M | re.I)
+            body, count = line.subn(lambda m, key=key, value=value: f"{key}={value}", body, count=1)
+            if not count:
+                missing.append(f"{key}={value}{newline}")
+        return text[:body_start] + "".join(missing) + body + text[body_end:]
+
     def copy_frik_ini(self):
         """Copy FRIK weapon offsets for Fallout London VR"""
         try:
@@ -6052,19 +6517,29 @@ class FalloutLondonVRInstaller:
                 logging.warning("Skipping weapon offsets copy - directory not found in bundled assets or installed location")
                 return
             
-            files = os.listdir(assets_dir)
-            if not files:
+            # One scandir pass gives names, file type and source mtime without extra stat calls
+            with os.scandir(assets_dir) as it:
+                entries = [entry for entry in it if entry.is_file()]
+            if not entries:
                 logging.warning(f"Weapon offsets directory is empty: {assets_dir}")
                 return
                 
-            for file in files:
-                src_file = os.path.join(assets_dir, file)
-                dest_file = os.path.join(dest_dir, file)
-                if os.path.isfile(src_file):
-                    shutil.copy2(src_file, dest_file)
-                    logging.info(f"Copied weapon offset file: {file}")
+            copied = 0
+            for entry in entries:
+                dest_file = os.path.join(dest_dir, entry.name)
+                # Skip only exact copies (same size and mtime); FRIK rewrites these files during play,
+                # so a newer destination is a user edit that still needs the London offsets
+                try:
+                    dest_stat, src_stat = os.stat(dest_file), entry.stat()
+                    if dest_stat.st_size == src_stat.st_size and int(dest_stat.st_mtime) == int(src_stat.st_mtime):
+                        continue
+                except OSError:
+                    pass
+                shutil.copy2(entry.path, dest_file)
+                copied += 1
+                logging.info(f"Copied weapon offset file: {entry.name}")
             
-            logging.info(f"Copied {len(files)} weapon offset files from {assets_dir}")
+            logging.info(f"Copied {copied} of {len(entries)} weapon offset files from {assets_dir}")
         except Exception as e:
             logging.error(f"Failed to copy weapon offset files: {e}")
 
@@ -6325,8 +6800,9 @@ class FalloutLondonVRInstaller:
     def launch_game_from_completion(self):
         """Launch the game directly from the completion screen.
         
-        We create a temporary batch file that waits briefly then launches MO2.
-        This allows the installer to fully exit before MO2 starts, preventing
+        MO2 is started as a detached process that breaks away from the installer's
+        job, with PyInstaller's environment and DLL search directory reset so it
+        holds nothing inside the temporary directory. The installer then exits immediately, which avoids
         the 'failed to remove temporary directory' error.
         """
         try:
@@ -6337,37 +6813,35 @@ class FalloutLondonVRInstaller:
                 logging.error(f"MO2 executable not found at {mo2_exe}")
                 return
             
-            logging.info(f"Launching game from completion screen via batch launcher")
-            
-            # Create a temporary VBScript that will:
-            # 1. Wait 2 seconds for installer to fully exit
-            # 2. Launch MO2 silently (no window)
-            # 3. Delete itself
-            vbs_content = f'''Set WshShell = CreateObject("WScript.Shell")
-WScript.Sleep 2000
-WshShell.CurrentDirectory = "{self.mo2_path.get()}"
-WshShell.Run """{mo2_exe}"" ""moshortcut://Portable:Fallout 4 VR""", 0, False
-Set fso = CreateObject("Scripting.FileSystemObject")
-fso.DeleteFile WScript.ScriptFullName
-'''
-            
-            # Write VBS file to user's temp directory (not PyInstaller's temp)
-            user_temp = os.environ.get('TEMP', os.environ.get('TMP', 'C:\\Windows\\Temp'))
-            vbs_path = os.path.join(user_temp, 'launch_fallout_london_vr.vbs')
-            
-            with open(vbs_path, 'w') as f:
-                f.write(vbs_content)
-            
-            # Launch the VBScript silently using wscript
-            CREATE_NO_WINDOW = 0x08000000
-            
-            subprocess.Popen(
-                ['wscript.exe', vbs_path],
-                creationflags=CREATE_NO_WINDOW,
-                close_fds=True
+            logging.info(f"Launching game from completion screen via detached process")
+            
+            # Strip PyInstaller's variables and bundle paths so MO2 doesn't load anything from _MEIPASS
+            env = {k: v for k, v in os.environ.items() if not k.startswith(('_MEI', '_PYI', 'TCL_', 'TK_'))}
+            meipass = getattr(sys, '_MEIPASS', None)
+            if meipass and 'PATH' in env:
+                env['PATH'] = os.pathsep.join(p for p in env['PATH'].split(os.pathsep)
+                                              if not os.path.normcase(p).startswith(os.path.normcase(meipass)))
+            if meipass:
+                # The bootloader's SetDllDirectoryW(_MEIPASS) is inherited by children, so reset it
+                # or MO2 picks up (and locks) runtime DLLs such as vcruntime140 from the bundle
+                _kernel32.SetDllDirectoryW(None)
+            
+            DETACHED_PROCESS = 0x00000008
+            CREATE_NEW_PROCESS_GROUP = 0x00000200
+            CREATE_BREAKAWAY_FROM_JOB = 0x01000000
+            flags = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+            launch_kwargs = dict(
+                cwd=self.mo2_path.get(), env=env, close_fds=True,
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
+            cmd = [mo2_exe, "moshortcut://Portable:Fallout 4 VR"]
+            try:
+                subprocess.Popen(cmd, creationflags=flags | CREATE_BREAKAWAY_FROM_JOB, **launch_kwargs)
+            except OSError:
+                # The installer's job may not permit breakaway; detached is still enough to outlive us
+                subprocess.Popen(cmd, creationflags=flags, **launch_kwargs)
             
-            logging.info("VBScript launcher started, closing installer")
+            logging.info("MO2 launched, closing installer")
             
             # Close the installer immediately
             self.root.destroy()
@@ -6426,6 +6900,46 @@ fso.DeleteFile WScript.ScriptFullName
             logging.error(f"Failed to exit installer: {e}")
             sys.exit(0)
 
+    def _iter_process_names_win32(self):
+        """Yield lowercase executable names of running processes via EnumProcesses (no per-process psutil objects)"""
+        kernel32 = _kernel32
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        count = 1024
+        while True:
+            pids = (wintypes.DWORD * count)()
+            needed = wintypes.DWORD()
+            if not kernel32.K32EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+                raise ctypes.WinError(ctypes.get_last_error())
+            if needed.value < ctypes.sizeof(pids):
+                break
+            count *= 2  # Buffer was full; there may be more processes
+        name_buf = ctypes.create_unicode_buffer(1024)
+        for pid in pids[:needed.value // ctypes.sizeof(wintypes.DWORD)]:
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                continue  # System/protected process or already exited
+            try:
+                size = wintypes.DWORD(len(name_buf))
+                if kernel32.QueryFullProcessImageNameW(wintypes.HANDLE(handle), 0, name_buf, ctypes.byref(size)):
+                    yield os.path.basename(name_buf.value).lower()
+            finally:
+                kernel32.CloseHandle(wintypes.HANDLE(handle))
+
+    def _is_process_running(self, exe_name):
+        """Return True as soon as a process with the given executable name is found"""
+        exe_name = exe_name.lower()
+        if sys.platform == "win32":
+            try:
+                return any(name == exe_name for name in self._iter_process_names_win32())
+            except OSError as e:
+                logging.debug(f"EnumProcesses failed, falling back to psutil: {e}")
+        # Only the prefetched name is read per process, and the scan stops at the first match
+        for proc in psutil.process_iter(['name']):
+            name = proc.info.get('name')
+            if name and name.lower() == exe_name:
+                return True
+        return False
+
     def launch_mo2(self):
         """Launch MO2, ensure Steam VR is running, and retry if game doesn't start"""
         try:
@@ -6440,22 +6954,23 @@ fso.DeleteFile WScript.ScriptFullName
                 return
             
             # Check if Steam VR is running
-            steam_vr_running = any("vrserver.exe" in proc.name().lower() for proc in psutil.process_iter(['name']))
+            steam_vr_running = self._is_process_running("vrserver.exe")
             logging.info(f"Steam VR running before launch: {steam_vr_running}")
             
             if not steam_vr_running:
                 # Attempt to start Steam VR
                 logging.info("Starting Steam VR via steam://run/250820")
-                subprocess.Popen(["start", "steam://run/250820"], shell=True)
+                os.startfile("steam://run/250820")  # ShellExecute the URI directly, no cmd.exe
                 
-                # Wait for Steam VR to initialize (up to 10 seconds)
-                start_time = time.time()
-                while time.time() - start_time < 10:
-                    steam_vr_running = any("vrserver.exe" in proc.name().lower() for proc in psutil.process_iter(['name']))
+                # Wait for Steam VR to initialize (up to 10 seconds); EnumProcesses is cheap enough to poll every 200ms
+                # so we continue as soon as vrserver.exe appears
+                start_time = time.monotonic()
+                while time.monotonic() - start_time < 10:
+                    time.sleep(0.2)
+                    steam_vr_running = self._is_process_running("vrserver.exe")
                     if steam_vr_running:
                         logging.info("Steam VR started successfully")
                         break
-                    time.sleep(1)
                 else:
                     logging.warning("Steam VR did not start within 10 seconds")
             
@@ -6473,9 +6988,12 @@ fso.DeleteFile WScript.ScriptFullName
             )
             logging.info(f"MO2 process started with PID: {process.pid}")
             
-            # Wait 10 seconds and check if Fallout4VR.exe is running
-            time.sleep(10)
-            game_running = any("fallout4vr.exe" in proc.name().lower() for proc in psutil.process_iter(['name']))
+            # Wait up to 10 seconds for Fallout4VR.exe, continuing as soon as it appears
+            deadline = time.monotonic() + 10
+            game_running = False
+            while not game_running and time.monotonic() < deadline:
+                time.sleep(0.3)
+                game_running = self._is_process_running("fallout4vr.exe")
             logging.info(f"Fallout 4 VR running after first attempt: {game_running}")
             
             if not game_running:
@@ -6494,98 +7012,162 @@ fso.DeleteFile WScript.ScriptFullName
             messagebox.showerror("Error", f"Failed to launch MO2: {e}")
             logging.error(f"Failed to launch MO2: {e}")
 
-    def download_with_memory_management(self, url, output_path, label_text, verify_ssl=True):
-        """Generic download function with proper memory management and retry logic"""
+    def download_with_memory_management(self, url, output_path, label_text, verify_ssl=True, show_progress=True, cancel_event=None):
+        """Generic download function with proper memory management and retry logic.
+
+        Pass show_progress=False for background downloads that run while another step owns the progress bar.
+        Setting cancel_event stops the download between reads or retries, deletes the partial file and
+        raises InterruptedError without posting any further status messages.
+        """
         max_retries = 5
         retry_delay = 5  # seconds between retries
         
-        self.create_progress_bar(f"Downloading {label_text}")
+        def cancelled():
+            return cancel_event is not None and cancel_event.is_set()
+        
+        if show_progress:
+            self.create_progress_bar(f"Downloading {label_text}")
+        
+        # Retries resume with a Range request; If-Range makes the server send the whole file again if it changed
+        resume_validator = None
+        expected_size = 0
         
         for attempt in range(1, max_retries + 1):
             try:
                 if attempt > 1:
-                    self.root.after(0, lambda a=attempt, lt=label_text: self.progress_label.config(
-                        text=f"Retrying {lt} download (attempt {a}/{max_retries})."))
-                    self.root.after(0, lambda: self.message_label.config(
-                        text="Trying to reconnect. Please check your internet connection.", fg="#ffaa00") if self.message_label.winfo_exists() else None)
-                    time.sleep(retry_delay)
+                    if cancelled():
+                        raise InterruptedError(f"{label_text} download cancelled")
+                    if show_progress:
+                        self._post_progress(label_text=f"Retrying {label_text} download (attempt {attempt}/{max_retries}).")
+                    self.update_message("Trying to reconnect. Please check your internet connection.", "#ffaa00")
+                    # Wait on the event rather than sleeping so a cancel doesn't sit out the delay
+                    if cancel_event is None:
+                        time.sleep(retry_delay)
+                    elif cancel_event.wait(retry_delay):
+                        raise InterruptedError(f"{label_text} download cancelled")
+                
+                headers = None
+                resume_from = 0
+                if resume_validator and os.path.exists(output_path):
+                    resume_from = os.path.getsize(output_path)
+                    if expected_size and resume_from == expected_size:
+                        logging.info(f"Downloaded {label_text} to {output_path}")
+                        return output_path
+                    if 0 < resume_from < expected_size:
+                        headers = {"Range": f"bytes={resume_from}-", "If-Range": resume_validator}
+                    else:
+                        resume_from = 0
                 
-                with requests.get(url, stream=True, verify=verify_ssl, timeout=30) as r:
+                with self._http.get(url, stream=True, verify=verify_ssl, timeout=(10, 30), headers=headers) as r:
                     r.raise_for_status()
                     
+                    if r.status_code == 206:
+                        logging.info(f"Resuming {label_text} download at {resume_from} bytes")
+                    else:
+                        resume_from = 0  # Range ignored or the file changed upstream; start over
+                        # Weak ETags can't be used with If-Range
+                        etag = r.headers.get('ETag')
+                        resume_validator = etag if etag and not etag.startswith("W/") else r.headers.get('Last-Modified')
+                    
                     # Connection restored - clear the warning message
                     if attempt > 1:
-                        self.root.after(0, lambda: self.message_label.config(
-                            text="Connection restored. Resuming download", fg="#00ff00") if self.message_label.winfo_exists() else None)
+                        self.update_message("Connection restored. Resuming download", "#00ff00")
                     
                     total_size = int(r.headers.get('content-length', 0))
-                    downloaded_size = 0
-                    chunk_size = 256 * 1024  # 256KB chunks for downloads
+                    if total_size > 0:
+                        total_size += resume_from
+                    if not resume_from:
+                        expected_size = total_size
+                    downloaded_size = resume_from
+                    chunk_size = 1024 * 1024  # 1MB reads into one reusable buffer
+                    buf = bytearray(chunk_size)
+                    view = memoryview(buf)
+                    last_reported = resume_from
+                    r.raw.decode_content = True
                     
-                    with open(output_path, 'wb') as f:
-                        for chunk in r.iter_content(chunk_size=chunk_size):
+                    # No periodic fsync - a failed download resumes from whatever reached the file.
+                    # O_SEQUENTIAL (Windows) hints the cache manager that the file is written front to back.
+                    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if resume_from else os.O_TRUNC)
+                    flags |= getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+                    with os.fdopen(os.open(output_path, flags, 0o666), 'wb', buffering=1024 * 1024) as f:
+                        while True:
                             if self.cancel_requested:
                                 raise InterruptedError("Installation cancelled by user")
+                            if cancelled():
+                                raise InterruptedError(f"{label_text} download cancelled")
                             
-                            f.write(chunk)
-                            downloaded_size += len(chunk)
-                            
-                            # Periodic flush to disk
-                            if downloaded_size % (10 * 1024 * 1024) == 0:  # Every 10MB
-                                f.flush()
-                                os.fsync(f.fileno())
+                            n = r.raw.readinto(buf)
+                            if not n:
+                                break
+                            f.write(view[:n])
+                            downloaded_size += n
                             
-                            # Update progress
-                            progress_percentage = (downloaded_size / total_size) * 100 if total_size > 0 else 0
-                            if self.progress and self.progress.winfo_exists():
-                                self.root.after(0, lambda pp=progress_percentage: 
-                                    self.progress.__setitem__("value", pp) if self.progress.winfo_exists() else None)
-                            if self.progress_label and self.progress_label.winfo_exists():
-                                self.root.after(0, lambda pp=progress_percentage, lt=label_text: 
-                                    self.progress_label.config(text=f"Downloading {lt} ({pp:.1f}%)") 
-                                    if self.progress_label.winfo_exists() else None)
+                            # Publish progress once per MB; only the newest value is rendered on the main thread
+                            if show_progress and downloaded_size - last_reported >= 1024 * 1024:
+                                last_reported = downloaded_size
+                                progress_percentage = (downloaded_size / total_size) * 100 if total_size > 0 else 0
+                                self._post_progress(progress_percentage, f"Downloading {label_text} ({progress_percentage:.1f}%)")
+                    
+                    if show_progress and total_size > 0:
+                        self._post_progress(100, f"Downloading {label_text} (100.0%)")
                 
                 logging.info(f"Downloaded {label_text} to {output_path}")
                 return output_path
                 
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, 
-                    requests.exceptions.ChunkedEncodingError) as e:
+                    requests.exceptions.ChunkedEncodingError,
+                    urllib3.exceptions.ProtocolError, urllib3.exceptions.ReadTimeoutError) as e:
+                # Reading r.raw directly surfaces urllib3 errors rather than the requests wrappers
                 logging.warning(f"Download attempt {attempt}/{max_retries} for {label_text} failed: {e}")
                 
+                if cancelled():
+                    self._discard_download(output_path)
+                    raise InterruptedError(f"{label_text} download cancelled")
                 if attempt < max_retries:
-                    self.root.after(0, lambda a=attempt, d=retry_delay, lt=label_text: self.progress_label.config(
-                        text=f"Connection failed. Retrying {lt} in {d}s (attempt {a}/{max_retries})."))
-                    self.root.after(0, lambda: self.message_label.config(
-                        text="Connection error. Please check your internet connection.", fg="#ffaa00") if self.message_label.winfo_exists() else None)
+                    if show_progress:
+                        self._post_progress(label_text=f"Connection failed. Retrying {label_text} in {retry_delay}s (attempt {attempt}/{max_retries}).")
+                    self.update_message("Connection error. Please check your internet connection.", "#ffaa00")
                 else:
                     error_msg = f"Failed to download {label_text}: Connection error after multiple attempts.\nPlease check your internet connection and try again."
-                    self.root.after(0, lambda m=error_msg: self.message_label.config(text=m, fg="#ff6666") if self.message_label.winfo_exists() else None)
+                    self.update_message(error_msg, "#ff6666")
                     logging.error(f"Failed to download {label_text} after {max_retries} attempts: {e}")
                     raise Exception(error_msg)
                     
             except requests.exceptions.HTTPError as e:
                 error_msg = f"Failed to download {label_text}: Server error {e.response.status_code}"
-                self.root.after(0, lambda m=error_msg: self.message_label.config(text=m, fg="#ff6666") if self.message_label.winfo_exists() else None)
+                self.update_message(error_msg, "#ff6666")
                 logging.error(f"Failed to download {label_text}: {e}")
                 raise Exception(error_msg)
                 
             except InterruptedError:
+                if cancelled():
+                    self._discard_download(output_path)
                 raise
                 
             except Exception as e:
+                if cancelled():
+                    self._discard_download(output_path)
+                    raise InterruptedError(f"{label_text} download cancelled")
                 if attempt < max_retries:
                     logging.warning(f"Download attempt {attempt}/{max_retries} for {label_text} failed: {e}")
                     continue
                 else:
                     error_msg = f"Failed to download {label_text}: {type(e).__name__}"
-                    self.root.after(0, lambda m=error_msg: self.message_label.config(text=m, fg="#ff6666") if self.message_label.winfo_exists() else None)
+                    self.update_message(error_msg, "#ff6666")
                     logging.error(f"Failed to download {label_text}: {e}")
                     raise Exception(error_msg)
 
+    def _discard_download(self, output_path):
+        """Delete a downloaded (or partially downloaded) archive that will not be used"""
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+
     def download_mo2_portable(self):
         """Download portable MO2 archive for inline installation"""
         mo2_url = "https://github.com/ModOrganizer2/modorganizer/releases/download/v2.5.2/Mod.Organizer-2.5.2.7z"
-        temp_dir = os.path.join(tempfile.gettempdir())
+        temp_dir = self._download_dir()
         mo2_archive = os.path.join(temp_dir, "Mod.Organizer-2.5.2.7z")
 
         self.root.after(0, lambda: self.message_label.config(text="Setting up Mod Organizer 2", fg="#ffffff") if self.message_label.winfo_exists() else None)
@@ -6593,6 +7175,34 @@ fso.DeleteFile WScript.ScriptFullName
         # Use the new generic download function
         return self.download_with_memory_management(mo2_url, mo2_archive, "MO2")
 
+    def _run_7za(self, extract_cmd, label_text, start=0.0, span=100.0):
+        """Run a 7za command, streaming its -bsp1 percentage into the progress bar; returns (returncode, stderr text)
+
+        Pass label_text=None to run without touching the progress bar (e.g. alongside other extractions).
+        Don't include -bd in extract_cmd: it disables the percentage output this parses.
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(extract_cmd + ["-bsp1"], stdout=subprocess.PIPE, stderr=stderr_file,
+                                    creationflags=subprocess.CREATE_NO_WINDOW)
+            last_percent = -1
+            try:
+                # 7za redraws its percentage with backspaces, so read raw blocks rather than lines
+                for data in iter(lambda: proc.stdout.read1(4096), b""):
+                    if self.cancel_requested:
+                        proc.kill()
+                        raise InterruptedError("Installation cancelled by user")
+                    if label_text is None:
+                        continue
+                    matches = SEVENZIP_PERCENT_PATTERN.findall(data)
+                    if matches and int(matches[-1]) != last_percent:
+                        last_percent = int(matches[-1])
+                        self._post_progress(start + span * last_percent / 100, f"{label_text} ({last_percent}%)")
+            finally:
+                proc.stdout.close()
+                returncode = proc.wait()
+            stderr_file.seek(0)
+            return returncode, stderr_file.read().decode(errors='replace')
+
     def extract_mo2(self, archive_path):
         """Extract MO2 and configure for portable mode"""
         mo2_extract_dir = self.mo2_path.get()  # Extract directly to install dir
@@ -6603,28 +7213,27 @@ fso.DeleteFile WScript.ScriptFullName
 
         try:
             # Use bundled 7za.exe instead of py7zr
-            bundled_7za = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "7za.exe")
+            bundled_7za = self._bundled_7za
             
             if not os.path.exists(bundled_7za):
                 raise FileNotFoundError(f"Bundled 7za.exe not found at {bundled_7za}")
 
             # Extract using bundled 7za
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting MO2"))
-            extract_cmd = [bundled_7za, "x", archive_path, f"-o{mo2_extract_dir}", "-y", "-bb0", "-bd"]
+            self._post_progress(0, "Extracting MO2")
+            extract_cmd = [bundled_7za, "x", archive_path, f"-o{mo2_extract_dir}", "-y", "-bb0",
+                           f"-mmt={os.cpu_count() or 'on'}", "-aoa"]  # Multithreaded LZMA2 decoding
             
             logging.info(f"Extracting MO2 using bundled 7za: {' '.join(extract_cmd)}")
-            result = subprocess.run(extract_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+            returncode, stderr_text = self._run_7za(extract_cmd, "Extracting MO2")
             
-            if result.returncode != 0:
-                logging.error(f"7za stdout: {result.stdout}")
-                logging.error(f"7za stderr: {result.stderr}")
-                raise Exception(f"7za extraction failed with code {result.returncode}: {result.stderr}")
+            if returncode != 0:
+                logging.error(f"7za stderr: {stderr_text}")
+                raise Exception(f"7za extraction failed with code {returncode}: {stderr_text}")
             
             logging.info(f"7za extraction successful")
             
             # Update progress to 100%
-            self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting MO2 (100%)"))
+            self._post_progress(100, "Extracting MO2 (100%)")
 
             # Configure for portable mode
             mo2_exe_path = os.path.join(mo2_extract_dir, "ModOrganizer.exe")
@@ -6728,10 +7337,16 @@ fso.DeleteFile WScript.ScriptFullName
         except Exception:
             pass
 
-        # Create progress label centered in the frame
+        # Create progress label centered in the frame (text and value are driven through Tk variables)
+        with self._ui_lock:
+            # Values left over from the previous phase must not land on the new bar
+            self._pending_ui.pop("progress", None)
+            self._pending_ui.pop("label", None)
+        self.progress_label_var.set(label_text)
+        self.progress_var.set(0.0)
         self.progress_label = tk.Label(
             self.progress_frame,
-            text=label_text,
+            textvariable=self.progress_label_var,
             font=self.bold_font,
             bg="#1e1e1e",
             fg="#ffffff"
@@ -6739,28 +7354,34 @@ fso.DeleteFile WScript.ScriptFullName
         self.progress_label.pack(pady=6)
 
         # Create progress bar centered in the frame
-        self.progress = ttk.Progressbar(self.progress_frame, length=300, mode="determinate")
+        self.progress = ttk.Progressbar(self.progress_frame, length=300, mode="determinate", variable=self.progress_var)
         self.progress.pack(pady=6)
+        self._progress_alive = True
+        for widget in (self.progress, self.progress_label):
+            widget.bind('<Destroy>', lambda e: setattr(self, '_progress_alive', False))
         self.root.update()
         return self.progress
 
-    def download_f4sevr(self):
+    def download_f4sevr(self, show_progress=True, cancel_event=None):
         """Download F4SEVR archive from official source with retry logic"""
         f4sevr_url = "https://f4se.silverlock.org/beta/f4sevr_0_6_21.7z"
-        temp_dir = os.path.join(tempfile.gettempdir())
+        temp_dir = self._download_dir()
         f4sevr_archive = os.path.join(temp_dir, "f4sevr_0_6_21.7z")
 
-        self.root.after(0, lambda: self.message_label.config(text="Setting up Fallout 4 Script Extender VR", fg="#ffffff") if self.message_label.winfo_exists() else None)
+        if show_progress:
+            self.root.after(0, lambda: self.message_label.config(text="Setting up Fallout 4 Script Extender VR", fg="#ffffff") if self.message_label.winfo_exists() else None)
         
         # Download F4SEVR using the retry-enabled download function
         # Note: verify_ssl=False because f4se.silverlock.org has a weak certificate
-        self.download_with_memory_management(f4sevr_url, f4sevr_archive, "F4SEVR", verify_ssl=False)
+        self.download_with_memory_management(f4sevr_url, f4sevr_archive, "F4SEVR", verify_ssl=False, show_progress=show_progress,
+                                             cancel_event=cancel_event)
         logging.info(f"Downloaded F4SEVR archive to {f4sevr_archive}")
         return f4sevr_archive
 
     def extract_and_install_f4sevr(self, archive_path, dest_dir):
         """Extract F4SEVR archive and install to Fallout 4 VR directory"""
-        temp_extract_dir = os.path.join(tempfile.gettempdir(), "f4sevr_extract")
+        # Stage inside the destination so installing is a same-volume rename rather than a second copy
+        temp_extract_dir = os.path.join(dest_dir, "_f4sevr_extract")
         
         self.root.after(0, lambda: self.message_label.config(text="Setting up Fallout 4 Script Extender VR", fg="#ffffff") if self.message_label.winfo_exists() else None)
         self.create_progress_bar("Extracting F4SEVR")
@@ -6773,24 +7394,25 @@ fso.DeleteFile WScript.ScriptFullName
             os.makedirs(temp_extract_dir, exist_ok=True)
 
             # Use bundled 7za.exe
-            bundled_7za = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "7za.exe")
+            bundled_7za = self._bundled_7za
             
             if not os.path.exists(bundled_7za):
                 raise FileNotFoundError(f"Bundled 7za.exe not found at {bundled_7za}")
 
             # Extract using bundled 7za
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting F4SEVR"))
-            extract_cmd = [bundled_7za, "x", archive_path, f"-o{temp_extract_dir}", "-y", "-bb0", "-bd"]
+            self._post_progress(0, "Extracting F4SEVR")
+            extract_cmd = [bundled_7za, "x", archive_path, f"-o{temp_extract_dir}", "-y", "-bb0",
+                           f"-mmt={os.cpu_count() or 'on'}", "-aoa"]  # Multithreaded LZMA2 decoding
             
-            result = subprocess.run(extract_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode != 0:
-                raise Exception(f"7za extraction failed: {result.stderr}")
+            # Extraction covers the first half of the bar, installing the files the second half
+            returncode, stderr_text = self._run_7za(extract_cmd, "Extracting F4SEVR", 0.0, 50.0)
+            if returncode != 0:
+                raise Exception(f"7za extraction failed: {stderr_text}")
             
             logging.info(f"Extracted F4SEVR using bundled 7za to {temp_extract_dir}")
 
             # Update progress to 50%
-            self.root.after(0, lambda: self.progress.__setitem__("value", 50))
-            self.root.after(0, lambda: self.progress_label.config(text="Installing F4SEVR files"))
+            self._post_progress(50, "Installing F4SEVR files")
 
             # Now copy files from temp directory to F4VR directory
             self.copy_f4sevr_files(temp_extract_dir, dest_dir)
@@ -6815,18 +7437,15 @@ fso.DeleteFile WScript.ScriptFullName
             raise
 
     def copy_f4sevr_files(self, src_dir, dest_dir):
-        """Copy F4SEVR files from extracted directory to Fallout 4 VR root directory"""
+        """Move F4SEVR files from extracted directory to Fallout 4 VR root directory (copy if on another volume)"""
         try:
             if not os.path.exists(src_dir):
                 raise FileNotFoundError(f"F4SEVR source directory not found: {src_dir}")
 
             # Check if there's a f4sevr_0_6_21 folder inside the extracted directory
-            f4sevr_folder = None
-            for item in os.listdir(src_dir):
-                item_path = os.path.join(src_dir, item)
-                if os.path.isdir(item_path) and item.startswith("f4sevr"):
-                    f4sevr_folder = item_path
-                    break
+            with os.scandir(src_dir) as it:
+                f4sevr_folder = next((entry.path for entry in it
+                                      if entry.is_dir(follow_symlinks=False) and entry.name.startswith("f4sevr")), None)
             
             # If we found the f4sevr folder, use its contents as the source
             if f4sevr_folder:
@@ -6840,27 +7459,11 @@ fso.DeleteFile WScript.ScriptFullName
             file_count = 0
             files_to_copy = []
             
-            # Calculate total size and build file list from the actual source directory
-            for dirpath, dirnames, filenames in os.walk(actual_src_dir):
-                for filename in filenames:
-                    src_file = os.path.join(dirpath, filename)
-                    
-                    # Calculate relative path from the actual source directory
-                    rel_path = os.path.relpath(dirpath, actual_src_dir)
-                    
-                    # Create corresponding path in destination
-                    if rel_path == '.':
-                        dest_file = os.path.join(dest_dir, filename)
-                    else:
-                        dest_file = os.path.join(dest_dir, rel_path, filename)
-                    
-                    try:
-                        file_size = os.path.getsize(src_file)
-                        total_size += file_size
-                        file_count += 1
-                        files_to_copy.append((src_file, dest_file, file_size))
-                    except OSError as e:
-                        logging.warning(f"Could not get size of {src_file}: {e}")
+            # Calculate total size and build file list in one scandir pass (sizes come from the directory entries)
+            for src_file, dest_file, file_size in self._iter_copy_pairs(actual_src_dir, dest_dir):
+                total_size += file_size
+                file_count += 1
+                files_to_copy.append((src_file, dest_file, file_size))
 
             logging.info(f"F4SEVR files prepared for copying")
             
@@ -6868,24 +7471,30 @@ fso.DeleteFile WScript.ScriptFullName
                 logging.warning(f"No files found to copy from {actual_src_dir}")
                 return
 
-            # Rest of the method remains the same...
+            self._make_dest_dirs(files_to_copy)
+
             copied_size = 0
             files_copied = 0
+            self._last_progress_update = 0.0
 
-            for src_file, dest_file, file_size in files_to_copy:
+            for index, (src_file, dest_file, file_size) in enumerate(files_to_copy, 1):
                 if self.cancel_requested:
                     raise InterruptedError("Installation cancelled by user")
 
-                # Create destination directory if it doesn't exist
-                dest_file_dir = os.path.dirname(dest_file)
-                os.makedirs(dest_file_dir, exist_ok=True)
-
                 try:
                     # Handle read-only files in destination
                     if os.path.exists(dest_file):
                         self.remove_readonly_and_overwrite(dest_file)
                     
-                    shutil.copy2(src_file, dest_file)
+                    try:
+                        # Staged on the destination volume, so this moves the file without copying data
+                        os.replace(src_file, dest_file)
+                    except OSError:
+                        if sys.platform == "win32":
+                            # Kernel-side copy (data and attributes) instead of bouncing through Python buffers
+                            self._copy_file_native(src_file, dest_file, file_size)
+                        else:
+                            shutil.copy2(src_file, dest_file)
                     copied_size += file_size
                     files_copied += 1
 
@@ -6903,10 +7512,12 @@ fso.DeleteFile WScript.ScriptFullName
                         # Continue with other files instead of failing completely
                         continue
 
-                # Update progress (50% offset from extraction)
-                progress_percentage = 50 + (copied_size / total_size) * 50
-                self.root.after(0, lambda pp=progress_percentage: self.progress.__setitem__("value", pp))
-                self.root.after(0, lambda pp=progress_percentage: self.progress_label.config(text=f"Installing F4SEVR ({pp:.1f}%)"))
+                # Update progress at most 10 times per second (50% offset from extraction)
+                now = time.monotonic()
+                if now - self._last_progress_update >= 0.1 or index == file_count:
+                    self._last_progress_update = now
+                    progress_percentage = 50 + (copied_size / total_size) * 50 if total_size > 0 else 100
+                    self._post_progress(progress_percentage, f"Installing F4SEVR ({progress_percentage:.1f}%)")
 
             logging.info(f"F4SEVR file copy completed: {files_copied} files copied")
 
@@ -6914,50 +7525,66 @@ fso.DeleteFile WScript.ScriptFullName
             logging.error(f"F4SEVR file copy failed: {e}")
             raise
 
+    def download_frik(self, show_progress=True):
+        """Download FRIK archive with retry logic"""
+        frik_url = "https://github.com/rollingrock/Fallout-4-VR-Body/releases/download/v0.76/FRIK.-.v0.76.10.-.20251201.7z"
+        temp_dir = self._download_dir()
+        frik_archive = os.path.join(temp_dir, "FRIK.v0.76.10.7z")
+
+        if show_progress:
+            self.update_message("Updating FRIK VR Body", "#ffffff")
+        
+        self.download_with_memory_management(frik_url, frik_archive, "FRIK", show_progress=show_progress)
+        logging.info(f"Downloaded FRIK archive to {frik_archive}")
+        return frik_archive
+
     def download_and_install_frik(self):
         """Download and install FRIK to mods directory"""
         try:
-            frik_url = "https://github.com/rollingrock/Fallout-4-VR-Body/releases/download/v0.76/FRIK.-.v0.76.10.-.20251201.7z"
-            temp_dir = os.path.join(tempfile.gettempdir())
-            frik_archive = os.path.join(temp_dir, "FRIK.v0.76.10.7z")
-            
-            self.root.after(0, lambda: self.message_label.config(text="Updating FRIK VR Body", fg="#ffffff") if self.message_label.winfo_exists() else None)
-            
-            # Download FRIK using the retry-enabled download function
-            self.download_with_memory_management(frik_url, frik_archive, "FRIK")
-            logging.info(f"Downloaded FRIK archive to {frik_archive}")
+            frik_archive = self.download_frik()
             
             # Extract FRIK
             self.extract_frik(frik_archive)
             
         except Exception as e:
             logging.error(f"FRIK installation failed: {e}")
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to install FRIK: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Failed to install FRIK: {e}", "#ff6666")
             raise
+        finally:
+            self._remove_download_dir()
 
-    def extract_frik(self, archive_path):
+    def extract_frik(self, archive_path, show_progress=True):
         """Extract FRIK to mods directory"""
         try:
             # Create FRIK mod directory
-            frik_mod_dir = os.path.join(self.mo2_path.get(), "mods", "FRIK")
+            frik_mod_dir = os.path.join(self._mods_dir, "FRIK")
             os.makedirs(frik_mod_dir, exist_ok=True)
             
-            self.root.after(0, lambda: self.message_label.config(text="Extracting FRIK VR Body", fg="#ffffff") if self.message_label.winfo_exists() else None)
-            self.create_progress_bar("Extracting FRIK")
+            if show_progress:
+                self.update_message("Extracting FRIK VR Body", "#ffffff")
+                self.create_progress_bar("Extracting FRIK")
+            
+            # Use bundled 7za.exe instead of py7zr
+            bundled_7za = self._bundled_7za
+            
+            if not os.path.exists(bundled_7za):
+                raise FileNotFoundError(f"Bundled 7za.exe not found at {bundled_7za}")
             
-            # Extract using py7zr since it's a .7z file
             logging.info(f"Extracting FRIK 7z archive: {archive_path}")
             logging.info(f"Archive size: {os.path.getsize(archive_path)} bytes")
             
             try:
-                # Extract all files at once instead of one by one
-                with py7zr.SevenZipFile(archive_path, mode='r') as z:
-                    # Extract all files
-                    z.extractall(path=frik_mod_dir)
+                if show_progress:
+                    self._post_progress(label_text="Extracting FRIK")
+                extract_cmd = [bundled_7za, "x", archive_path, f"-o{frik_mod_dir}", "-y", "-bb0",
+                               f"-mmt={os.cpu_count() or 'on'}", "-aoa"]  # Multithreaded LZMA2 decoding
+                returncode, stderr_text = self._run_7za(extract_cmd, "Extracting FRIK" if show_progress else None)
+                if returncode != 0:
+                    raise Exception(f"7za extraction failed with code {returncode}: {stderr_text}")
                     
                 # Update progress to 100%
-                self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-                self.root.after(0, lambda: self.progress_label.config(text=f"Extracting FRIK (100%)"))
+                if show_progress:
+                    self._post_progress(100, "Extracting FRIK (100%)")
             
             except Exception as extract_error:
                 # Log detailed error information
@@ -6970,7 +7597,7 @@ fso.DeleteFile WScript.ScriptFullName
                 # Clean up partial extraction
                 if os.path.exists(frik_mod_dir):
                     try:
-                        shutil.rmtree(frik_mod_dir)
+                        self._remove_tree(frik_mod_dir)
                         logging.info(f"Removed partial extraction: {frik_mod_dir}")
                     except Exception as cleanup_error:
                         logging.warning(f"Failed to remove partial extraction: {cleanup_error}")
@@ -6983,139 +7610,182 @@ fso.DeleteFile WScript.ScriptFullName
                 os.unlink(archive_path)
             
             logging.info(f"Extracted FRIK to {frik_mod_dir}")
-            self.root.after(0, lambda: self.message_label.config(text="FRIK installed successfully.", fg="#ffffff") if self.message_label.winfo_exists() else None)
+            self.update_message("FRIK installed successfully.", "#ffffff")
             
         except Exception as e:
             logging.error(f"Failed to extract FRIK: {e}")
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to extract FRIK: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Failed to extract FRIK: {e}", "#ff6666")
             raise
 
+    def download_comfort_swim(self, show_progress=True):
+        """Download Comfort Swim VR archive with retry logic"""
+        comfort_swim_url = "https://github.com/ArthurHub/F4VRComfortSwim/releases/download/v0.3.0/Comfort.Swim.VR.-.v0.3.0.-.20250711.7z"
+        temp_dir = self._download_dir()
+        comfort_swim_archive = os.path.join(temp_dir, "Comfort.Swim.VR.-.v0.3.0.-.20250711.7z")
+
+        if show_progress:
+            self.update_message("Setting up Comfort Swim VR", "#ffffff")
+        
+        self.download_with_memory_management(comfort_swim_url, comfort_swim_archive, "Comfort Swim VR", show_progress=show_progress)
+        logging.info(f"Downloaded Comfort Swim VR archive to {comfort_swim_archive}")
+        return comfort_swim_archive
+
     def download_and_install_comfort_swim(self):
         """Download and install Comfort Swim VR mod"""
         try:
-            comfort_swim_url = "https://github.com/ArthurHub/F4VRComfortSwim/releases/download/v0.3.0/Comfort.Swim.VR.-.v0.3.0.-.20250711.7z"
-            temp_dir = os.path.join(tempfile.gettempdir())
-            comfort_swim_archive = os.path.join(temp_dir, "Comfort.Swim.VR.-.v0.3.0.-.20250711.7z")
-            
-            self.root.after(0, lambda: self.message_label.config(text="Setting up Comfort Swim VR", fg="#ffffff") if self.message_label.winfo_exists() else None)
-            
-            # Download Comfort Swim VR using the retry-enabled download function
-            self.download_with_memory_management(comfort_swim_url, comfort_swim_archive, "Comfort Swim VR")
-            logging.info(f"Downloaded Comfort Swim VR archive to {comfort_swim_archive}")
+            comfort_swim_archive = self.download_comfort_swim()
             
             # Extract Comfort Swim VR
             self.extract_comfort_swim(comfort_swim_archive)
             
         except Exception as e:
             logging.error(f"Comfort Swim VR installation failed: {e}")
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to install Comfort Swim VR: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Failed to install Comfort Swim VR: {e}", "#ff6666")
             raise
+        finally:
+            self._remove_download_dir()
 
-    def extract_comfort_swim(self, archive_path):
+    def extract_comfort_swim(self, archive_path, show_progress=True):
         """Extract Comfort Swim VR to mods directory"""
         try:
             # Create Comfort Swim VR mod directory
-            comfort_swim_mod_dir = os.path.join(self.mo2_path.get(), "mods", "Comfort Swim VR")
+            comfort_swim_mod_dir = os.path.join(self._mods_dir, "Comfort Swim VR")
             os.makedirs(comfort_swim_mod_dir, exist_ok=True)
             
-            self.root.after(0, lambda: self.message_label.config(text="Extracting Comfort Swim VR", fg="#ffffff") if self.message_label.winfo_exists() else None)
-            self.create_progress_bar("Extracting Comfort Swim VR")
+            if show_progress:
+                self.update_message("Extracting Comfort Swim VR", "#ffffff")
+                self.create_progress_bar("Extracting Comfort Swim VR")
             
             # Use bundled 7za.exe for extraction
-            bundled_7za = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "7za.exe")
+            bundled_7za = self._bundled_7za
             
             if not os.path.exists(bundled_7za):
                 raise FileNotFoundError(f"Bundled 7za.exe not found at {bundled_7za}")
             
             # Extract using bundled 7za
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting Comfort Swim VR"))
-            extract_cmd = [bundled_7za, "x", archive_path, f"-o{comfort_swim_mod_dir}", "-y", "-bb0", "-bd"]
-            
-            result = subprocess.run(extract_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode != 0:
-                raise Exception(f"7za extraction failed: {result.stderr}")
+            if show_progress:
+                self._post_progress(label_text="Extracting Comfort Swim VR")
+            extract_cmd = [bundled_7za, "x", archive_path, f"-o{comfort_swim_mod_dir}", "-y", "-bb0",
+                           f"-mmt={os.cpu_count() or 'on'}", "-aoa"]  # Multithreaded LZMA2 decoding
+            returncode, stderr_text = self._run_7za(extract_cmd, "Extracting Comfort Swim VR" if show_progress else None)
+            if returncode != 0:
+                raise Exception(f"7za extraction failed with code {returncode}: {stderr_text}")
             
             # Update progress to 100%
-            self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting Comfort Swim VR (100%)"))
+            if show_progress:
+                self._post_progress(100, "Extracting Comfort Swim VR (100%)")
             
             # Clean up archive
             if os.path.exists(archive_path):
                 os.unlink(archive_path)
             
             logging.info(f"Extracted Comfort Swim VR to {comfort_swim_mod_dir}")
-            self.root.after(0, lambda: self.message_label.config(text="Comfort Swim VR installed successfully.", fg="#ffffff") if self.message_label.winfo_exists() else None)
+            self.update_message("Comfort Swim VR installed successfully.", "#ffffff")
             
         except Exception as e:
             logging.error(f"Failed to extract Comfort Swim VR: {e}")
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to extract Comfort Swim VR: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Failed to extract Comfort Swim VR: {e}", "#ff6666")
             raise
 
+    def download_buffout4(self, show_progress=True):
+        """Download Buffout 4 NG archive with retry logic"""
+        buffout4_url = "https://github.com/alandtse/Buffout4/releases/download/v1.37.0/Buffout4_NG-1.37.0.7z"
+        temp_dir = self._download_dir()
+        buffout4_archive = os.path.join(temp_dir, "Buffout4_NG-1.37.0.7z")
+
+        if show_progress:
+            self.update_message("Setting up Buffout 4 NG", "#ffffff")
+        
+        self.download_with_memory_management(buffout4_url, buffout4_archive, "Buffout 4 NG", show_progress=show_progress)
+        logging.info(f"Downloaded Buffout 4 NG archive to {buffout4_archive}")
+        return buffout4_archive
+
     def download_and_install_buffout4(self):
         """Download and install Buffout 4 NG mod"""
         try:
-            buffout4_url = "https://github.com/alandtse/Buffout4/releases/download/v1.37.0/Buffout4_NG-1.37.0.7z"
-            temp_dir = os.path.join(tempfile.gettempdir())
-            buffout4_archive = os.path.join(temp_dir, "Buffout4_NG-1.37.0.7z")
-            
-            self.root.after(0, lambda: self.message_label.config(text="Setting up Buffout 4 NG", fg="#ffffff") if self.message_label.winfo_exists() else None)
-            
-            # Download Buffout 4 NG using the retry-enabled download function
-            self.download_with_memory_management(buffout4_url, buffout4_archive, "Buffout 4 NG")
-            logging.info(f"Downloaded Buffout 4 NG archive to {buffout4_archive}")
+            buffout4_archive = self.download_buffout4()
             
             # Extract Buffout 4 NG
             self.extract_buffout4(buffout4_archive)
             
         except Exception as e:
             logging.error(f"Buffout 4 NG installation failed: {e}")
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to install Buffout 4 NG: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Failed to install Buffout 4 NG: {e}", "#ff6666")
             raise
+        finally:
+            self._remove_download_dir()
 
-    def extract_buffout4(self, archive_path):
+    def extract_buffout4(self, archive_path, show_progress=True):
         """Extract Buffout 4 NG to mods directory"""
         try:
             # Create Buffout 4 NG mod directory
-            buffout4_mod_dir = os.path.join(self.mo2_path.get(), "mods", "Buffout 4 NG")
+            buffout4_mod_dir = os.path.join(self._mods_dir, "Buffout 4 NG")
             os.makedirs(buffout4_mod_dir, exist_ok=True)
             
-            self.root.after(0, lambda: self.message_label.config(text="Extracting Buffout 4 NG", fg="#ffffff") if self.message_label.winfo_exists() else None)
-            self.create_progress_bar("Extracting Buffout 4 NG")
+            if show_progress:
+                self.update_message("Extracting Buffout 4 NG", "#ffffff")
+                self.create_progress_bar("Extracting Buffout 4 NG")
             
             # Use bundled 7za.exe for extraction
-            bundled_7za = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "7za.exe")
+            bundled_7za = self._bundled_7za
             
             if not os.path.exists(bundled_7za):
                 raise FileNotFoundError(f"Bundled 7za.exe not found at {bundled_7za}")
             
             # Extract using bundled 7za
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting Buffout 4 NG"))
-            extract_cmd = [bundled_7za, "x", archive_path, f"-o{buffout4_mod_dir}", "-y", "-bb0", "-bd"]
-            
-            result = subprocess.run(extract_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode != 0:
-                raise Exception(f"7za extraction failed: {result.stderr}")
+            if show_progress:
+                self._post_progress(label_text="Extracting Buffout 4 NG")
+            extract_cmd = [bundled_7za, "x", archive_path, f"-o{buffout4_mod_dir}", "-y", "-bb0",
+                           f"-mmt={os.cpu_count() or 'on'}", "-aoa"]  # Multithreaded LZMA2 decoding
+            returncode, stderr_text = self._run_7za(extract_cmd, "Extracting Buffout 4 NG" if show_progress else None)
+            if returncode != 0:
+                raise Exception(f"7za extraction failed with code {returncode}: {stderr_text}")
             
             # Update progress to 100%
-            self.root.after(0, lambda: self.progress.__setitem__("value", 100))
-            self.root.after(0, lambda: self.progress_label.config(text="Extracting Buffout 4 NG (100%)"))
+            if show_progress:
+                self._post_progress(100, "Extracting Buffout 4 NG (100%)")
             
             # Clean up archive
             if os.path.exists(archive_path):
                 os.unlink(archive_path)
             
             logging.info(f"Extracted Buffout 4 NG to {buffout4_mod_dir}")
-            self.root.after(0, lambda: self.message_label.config(text="Buffout 4 NG installed successfully.", fg="#ffffff") if self.message_label.winfo_exists() else None)
+            self.update_message("Buffout 4 NG installed successfully.", "#ffffff")
             
         except Exception as e:
             logging.error(f"Failed to extract Buffout 4 NG: {e}")
-            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to extract Buffout 4 NG: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            self.update_message(f"Failed to extract Buffout 4 NG: {e}", "#ff6666")
             raise
 
-    def create_desktop_shortcut(self):
+    def _save_shortcut(self, shell, shortcut_path, target, arguments, working_dir, icon_location, description):
+        """Write a single .lnk through an existing WScript.Shell dispatch"""
+        shortcut = shell.CreateShortCut(shortcut_path)
+        shortcut.Targetpath = target
+        shortcut.Arguments = arguments
+        shortcut.WorkingDirectory = working_dir
+        shortcut.IconLocation = icon_location
+        shortcut.Description = description
+        shortcut.save()
+
+    def create_shortcuts(self):
+        """Create the desktop and Start Menu shortcuts with one WScript.Shell dispatch"""
+        try:
+            import win32com.client
+            shell = win32com.client.Dispatch('WScript.Shell')
+        except Exception as e:
+            logging.error(f"Failed to initialize WScript.Shell: {e}")
+            self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to create shortcut: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
+            return
+        
+        self.create_desktop_shortcut(shell)
+        self.create_start_menu_shortcuts(shell)
+
+    def create_desktop_shortcut(self, shell=None):
         """Create a desktop shortcut to launch MO2 and start the game with custom icon"""
         try:
-            import win32com.client  # Already available via your imports
+            if shell is None:
+                import win32com.client
+                shell = win32com.client.Dispatch('WScript.Shell')
             
             mo2_exe = os.path.join(self.mo2_path.get(), "ModOrganizer.exe")
             if not os.path.exists(mo2_exe):
@@ -7127,20 +7797,14 @@ fso.DeleteFile WScript.ScriptFullName
             shortcut_path = os.path.join(desktop, "Fallout London VR.lnk")
             
             # Get icon path (from your assets)
-            icon_path = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "icon.ico")
+            icon_path = self._icon_path
             if not os.path.exists(icon_path):
                 logging.warning(f"Icon not found at {icon_path}; shortcut will use default icon")
                 icon_path = mo2_exe  # Fallback to MO2's icon
             
-            # Create shortcut
-            shell = win32com.client.Dispatch('WScript.Shell')
-            shortcut = shell.CreateShortCut(shortcut_path)
-            shortcut.Targetpath = mo2_exe
-            shortcut.Arguments = '"moshortcut://Portable:Fallout 4 VR"'
-            shortcut.WorkingDirectory = self.mo2_path.get()
-            shortcut.IconLocation = f"{icon_path},0"  # 0 is the icon index
-            shortcut.Description = "Launch Fallout: London VR via ModOrganizer2"
-            shortcut.save()
+            # Create shortcut; 0 is the icon index
+            self._save_shortcut(shell, shortcut_path, mo2_exe, '"moshortcut://Portable:Fallout 4 VR"', self.mo2_path.get(),
+                                f"{icon_path},0", "Launch Fallout: London VR via ModOrganizer2")
             
             logging.info(f"Created desktop shortcut at {shortcut_path} with icon {icon_path}")
             self.root.after(0, lambda: self.message_label.config(text="") if self.message_label.winfo_exists() else None)
@@ -7149,10 +7813,12 @@ fso.DeleteFile WScript.ScriptFullName
             logging.error(f"Failed to create desktop shortcut: {e}")
             self.root.after(0, lambda es=str(e): self.message_label.config(text=f"Failed to create shortcut: {es}", fg="#ff6666") if self.message_label.winfo_exists() else None)
 
-    def create_start_menu_shortcuts(self):
+    def create_start_menu_shortcuts(self, shell=None):
         """Create Start Menu folder with game and MO2 shortcuts"""
         try:
-            import win32com.client
+            if shell is None:
+                import win32com.client
+                shell = win32com.client.Dispatch('WScript.Shell')
             
             mo2_exe = os.path.join(self.mo2_path.get(), "ModOrganizer.exe")
             if not os.path.exists(mo2_exe):
@@ -7168,57 +7834,35 @@ fso.DeleteFile WScript.ScriptFullName
             logging.info(f"Created Start Menu folder: {fallout_london_folder}")
             
             # Get icon path
-            icon_path = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "icon.ico")
+            icon_path = self._icon_path
             if not os.path.exists(icon_path):
                 logging.warning(f"Icon not found at {icon_path}; shortcuts will use default icons")
                 icon_path = mo2_exe  # Fallback to MO2's icon
             
-            shell = win32com.client.Dispatch('WScript.Shell')
+            # The donation link points at rundll32 url.dll,FileProtocolHandler so it opens in the default browser
+            donation_url = "https://ko-fi.com/falloutlondonvr"
+            rundll32 = os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'System32', 'rundll32.exe')
+            
+            # (file name, target, arguments, working dir, icon, description, required)
+            # A failed game or MO2 shortcut aborts like before; only the donation link is optional
+            shortcuts = [
+                ("Fallout London VR.lnk", mo2_exe, '"moshortcut://Portable:Fallout 4 VR"', self.mo2_path.get(),
+                 f"{icon_path},0", "Launch Fallout: London VR via ModOrganizer2", True),
+                ("Mod Organizer 2.lnk", mo2_exe, "", self.mo2_path.get(),
+                 f"{mo2_exe},0", "Open Mod Organizer 2 for Fallout: London VR", True),
+                ("Donation page.lnk", rundll32, f"url.dll,FileProtocolHandler {donation_url}", os.path.expanduser("~"),
+                 f"{icon_path},0", "Open the Fallout London VR donation page", False),
+            ]
             
-            # Create "Fallout London VR" shortcut (launches game)
-            game_shortcut_path = os.path.join(fallout_london_folder, "Fallout London VR.lnk")
-            game_shortcut = shell.CreateShortCut(game_shortcut_path)
-            game_shortcut.Targetpath = mo2_exe
-            game_shortcut.Arguments = '"moshortcut://Portable:Fallout 4 VR"'
-            game_shortcut.WorkingDirectory = self.mo2_path.get()
-            game_shortcut.IconLocation = f"{icon_path},0"
-            game_shortcut.Description = "Launch Fallout: London VR via ModOrganizer2"
-            game_shortcut.save()
-            logging.info(f"Created game shortcut: {game_shortcut_path}")
-            
-            # Create "Mod Organizer 2" shortcut (launches MO2 directly)
-            mo2_shortcut_path = os.path.join(fallout_london_folder, "Mod Organizer 2.lnk")
-            mo2_shortcut = shell.CreateShortCut(mo2_shortcut_path)
-            mo2_shortcut.Targetpath = mo2_exe
-            mo2_shortcut.Arguments = ""  # No arguments - just open MO2
-            mo2_shortcut.WorkingDirectory = self.mo2_path.get()
-            mo2_shortcut.IconLocation = f"{mo2_exe},0"  # Use MO2's own icon
-            mo2_shortcut.Description = "Open Mod Organizer 2 for Fallout: London VR"
-            mo2_shortcut.save()
-            logging.info(f"Created MO2 shortcut: {mo2_shortcut_path}")
-
-            # Create "Donation page" shortcut that opens the donation URL in the user's default browser
-            try:
-                donation_shortcut_path = os.path.join(fallout_london_folder, "Donation page.lnk")
-                donation_url = "https://ko-fi.com/falloutlondonvr"
-
-                # We'll create a small .lnk that points to rundll32 url.dll,FileProtocolHandler <url>
-                # This approach opens the URL using the default browser.
-                donation_shortcut = shell.CreateShortCut(donation_shortcut_path)
-                donation_shortcut.Targetpath = os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'System32', 'rundll32.exe')
-                donation_shortcut.Arguments = f"url.dll,FileProtocolHandler {donation_url}"
-                donation_shortcut.WorkingDirectory = os.path.expanduser("~")
-                # Use the icon from the assets if available, else let Windows pick default browser icon
-                favicon_path = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(__file__)), "assets", "icon.ico")
-                if os.path.exists(favicon_path):
-                    donation_shortcut.IconLocation = f"{favicon_path},0"
-                else:
-                    donation_shortcut.IconLocation = f"{mo2_exe},0"
-                donation_shortcut.Description = "Open the Fallout London VR donation page"
-                donation_shortcut.save()
-                logging.info(f"Created donation shortcut: {donation_shortcut_path}")
-            except Exception as e:
-                logging.warning(f"Failed to create donation Start Menu shortcut: {e}")
+            for name, target, arguments, working_dir, icon_location, description, required in shortcuts:
+                shortcut_path = os.path.join(fallout_london_folder, name)
+                try:
+                    self._save_shortcut(shell, shortcut_path, target, arguments, working_dir, icon_location, description)
+                    logging.info(f"Created Start Menu shortcut: {shortcut_path}")
+                except Exception as e:
+                    if required:
+                        raise
+                    logging.warning(f"Failed to create Start Menu shortcut {name}: {e}")
             
             logging.info(f"Successfully created Start Menu shortcuts in {fallout_london_folder}")
             
@@ -7226,7 +7870,6 @@ fso.DeleteFile WScript.ScriptFullName
             logging.error(f"Failed to create Start Menu shortcuts: {e}")
             # Non-critical error, don't show to user
 
-
 def main():
     """Main function to start the installer"""
     try: